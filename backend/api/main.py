@@ -3,7 +3,7 @@
 import asyncio
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,7 +28,8 @@ from process_manager import (
     EventType as PMEventType,
     Priority,
 )
-from voice import get_voice_handler, get_stt
+from voice import get_voice_handler
+from voice.tts import SAMPLE_RATE, STREAM_FORMAT
 
 logger = get_logger(__name__)
 
@@ -261,22 +262,18 @@ async def lifespan(app: FastAPI):
     # Preload Whisper model for faster first transcription
     # Using "base" model for speed (142MB, very fast, good accuracy)
     # Options: tiny (fastest), base (fast), small (balanced), medium (accurate)
-    try:
-        logger.info("Preloading Whisper STT model (base)...")
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: get_stt("base"))
-        logger.info("Whisper model preloaded successfully")
-    except Exception as e:
-        logger.warning(f"Failed to preload Whisper model: {e}")
-        logger.warning("Model will load on first voice request")
+    # Creating the voice handler starts the load in the background, so it
+    # overlaps with the rest of startup instead of blocking it
+    logger.info("Preloading Whisper STT model (base) in the background...")
+    get_voice_handler(whisper_model="base")
 
     # Preload Kokoro TTS model for faster first synthesis
     # Downloads ~80MB model from Hugging Face on first run
     try:
         from voice.tts import get_tts
         logger.info("Preloading Kokoro TTS model...")
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: get_tts())
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, get_tts)
         logger.info("Kokoro TTS model preloaded successfully")
     except Exception as e:
         logger.warning(f"Failed to preload Kokoro TTS model: {e}")
@@ -338,25 +335,29 @@ async def health_check():
 
 
 @app.get("/api/voices")
-async def list_voices():
+async def list_voices(language: Optional[str] = None, gender: Optional[str] = None):
     """
-    Get all available Kokoro TTS voices.
+    Get available Kokoro TTS voices.
+
+    Args:
+        language: Only return voices for this language (e.g. "Japanese")
+        gender: Only return voices of this gender ("female" or "male")
 
     Returns:
         List of voice objects with id, name, gender, and language
     """
-    from voice.tts import get_available_voices
+    from voice.tts import find_voices, get_available_voices
 
     voices = get_available_voices()
     return {
         "voices": [
             {
                 "id": voice_id,
-                "name": info["name"],
-                "gender": info["gender"],
-                "language": info["lang"],
+                "name": voices[voice_id]["name"],
+                "gender": voices[voice_id]["gender"],
+                "language": voices[voice_id]["lang"],
             }
-            for voice_id, info in voices.items()
+            for voice_id in find_voices(language, gender)
         ]
     }
 
@@ -682,15 +683,19 @@ async def handle_voice_audio(websocket: WebSocket, payload: dict) -> None:
     the transcription back to the frontend. The frontend decides
     whether to auto-send or put in input field for editing.
 
+    Audio arrives either raw from a binary frame ("audio_bytes") or
+    base64 encoded in a JSON message ("audio", legacy).
+
     Args:
         websocket: The client's WebSocket connection
-        payload: Contains base64 audio, format, and auto_send flag
+        payload: Contains audio, format, and auto_send flag
     """
+    audio_bytes = payload.get("audio_bytes")
     audio_b64 = payload.get("audio", "")
     audio_format = payload.get("format", "webm")
     auto_send = payload.get("auto_send", False)  # Default: put in input field
 
-    if not audio_b64:
+    if not audio_bytes and not audio_b64:
         await send_error(
             websocket,
             ErrorCode.MISSING_FIELD,
@@ -702,8 +707,9 @@ async def handle_voice_audio(websocket: WebSocket, payload: dict) -> None:
         # Get voice handler (lazy-loads Whisper model on first use)
         handler = get_voice_handler()
 
-        # Decode base64 audio
-        audio_bytes = handler.decode_audio(audio_b64)
+        # Binary frames carry raw audio; only legacy messages need decoding
+        if not audio_bytes:
+            audio_bytes = handler.decode_audio(audio_b64)
         logger.info(f"Received audio: {len(audio_bytes)} bytes ({audio_format})")
 
         # Transcribe with local Whisper (FREE, runs in thread pool)
@@ -768,7 +774,7 @@ async def handle_voice_tts(websocket: WebSocket, payload: dict) -> None:
 
         logger.info(f"Synthesizing TTS: {len(text)} chars")
 
-        # Stream audio chunks back to frontend (Kokoro outputs WAV)
+        # Stream audio chunks back to frontend (Kokoro streams raw PCM)
         async for chunk in handler.synthesize_stream(text):
             await manager.send(
                 websocket,
@@ -776,7 +782,8 @@ async def handle_voice_tts(websocket: WebSocket, payload: dict) -> None:
                     event_type=EventType.VOICE_AUDIO_CHUNK,
                     payload={
                         "audio": handler.encode_audio(chunk),
-                        "format": "wav",
+                        "format": STREAM_FORMAT,
+                        "sample_rate": SAMPLE_RATE,
                     },
                 ),
             )
@@ -846,26 +853,41 @@ async def websocket_endpoint(websocket: WebSocket):
     Handles connection lifecycle and message routing.
     Messages are queued and processed in order.
     Includes comprehensive error handling for graceful recovery.
+
+    Text frames carry JSON events. Binary frames carry voice audio
+    without base64: a JSON event header, a newline, then the raw audio
+    bytes, which are passed to the handler as payload["audio_bytes"].
     """
     await manager.connect(websocket)
 
     try:
         while True:
             try:
-                # Receive raw message
-                raw_data = await websocket.receive_text()
+                # Receive raw message (JSON text, or binary voice frame)
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+
+                audio_bytes = None
+                if frame.get("bytes") is not None:
+                    raw_data, _, audio_bytes = frame["bytes"].partition(b"\n")
+                else:
+                    raw_data = frame.get("text") or ""
 
                 # Parse JSON
                 try:
                     import json
+                    # Binary frame headers are bytes; a non-UTF-8 header
+                    # is as malformed as bad JSON
                     data = json.loads(raw_data)
-                except json.JSONDecodeError as e:
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
                     logger.warning(f"Invalid JSON received: {e}")
+                    position = e.pos if isinstance(e, json.JSONDecodeError) else e.start
                     await send_error(
                         websocket,
                         ErrorCode.INVALID_JSON,
                         "Message must be valid JSON",
-                        details={"position": e.pos},
+                        details={"position": position},
                     )
                     continue  # Keep connection alive
 
@@ -888,6 +910,12 @@ async def websocket_endpoint(websocket: WebSocket):
 
                 logger.debug(f"Received: {data}")
 
+                # Attach raw audio from a binary frame to the event payload
+                if audio_bytes is not None:
+                    if not isinstance(data.get("payload"), dict):
+                        data["payload"] = {}
+                    data["payload"]["audio_bytes"] = audio_bytes
+
                 # Add to queue for processing (non-blocking)
                 await message_processor.enqueue(websocket, data)
 
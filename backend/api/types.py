@@ -199,7 +199,7 @@ class ApprovalResponsePayload(BaseModel):
 class VoiceAudioPayload(BaseModel):
     """Payload for voice audio events (frontend -> backend)."""
 
-    audio: str  # Base64 encoded audio
+    audio: str = ""  # Base64 encoded audio (empty when sent as a binary frame)
     format: str = "webm"  # Audio format (webm, wav, mp3)
 
 
@@ -215,7 +215,8 @@ class VoiceAudioChunkPayload(BaseModel):
     """Payload for TTS audio chunk events (backend -> frontend)."""
 
     audio: str  # Base64 encoded audio chunk
-    format: str = "mp3"
+    format: str = "pcm_s16le"  # Raw 16-bit PCM, or a container like wav
+    sample_rate: int | None = None  # Required for raw PCM
 
 
 class VoiceErrorPayload(BaseModel):
@@ -35,6 +35,13 @@ class Settings(BaseSettings):
     # Claude Code Integration (Optional)
     claude_code_oauth_token: Optional[str] = None
 
+    # Voice
+    tts_backend: str = "torch"  # "torch" (kokoro) or "onnx" (kokoro-onnx)
+    tts_mixed_precision: bool = False  # bf16/fp16 autocast for Kokoro's encoders on CUDA
+    tts_concurrent_requests: int = 2  # Synthesis requests in flight at once
+    tts_int8: bool = False  # int8 dynamic quantization for Kokoro on CPU
+    tts_idle_offload_seconds: float = 60.0  # Move Kokoro off the GPU when idle (0 = never)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._create_data_directories()
@@ -46,6 +53,7 @@ class Settings(BaseSettings):
             self.data_dir / "chroma",
             self.data_dir / "logs",
             self.data_dir / "whisper",
+            self.data_dir / "kokoro",
         ]
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
@@ -7,8 +7,9 @@ using mem0's intelligent extraction capabilities.
 Supports mode-based filtering (work, personal, general).
 """
 
+import itertools
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from .memory_service import MemoryService, MemoryResult
 from .user_profile import Mode, MODE_CONTEXTS, get_current_mode
@@ -198,12 +199,10 @@ class ConversationMemoryHandler:
         if not memories:
             return ""
 
-        # Filter by mode if enabled
+        # Filter by mode if enabled, stopping at the requested count
         if filter_by_mode:
             memories = self._filter_by_mode(memories)
-
-        # Limit to requested count
-        memories = memories[:limit]
+        memories = list(itertools.islice(memories, limit))
 
         return self._format_context(memories)
 
@@ -246,20 +245,17 @@ class ConversationMemoryHandler:
             limit=fetch_limit,
         )
 
-        # Filter by agent if specified
-        if agent:
-            memories = [m for m in memories if m.metadata.get("agent") == agent]
-
-        # Filter by mode if enabled
+        # Score, agent and mode filters are chained lazily so the results
+        # are walked once and the walk stops at the requested count
+        candidates: Iterable[MemoryResult] = (
+            mem for mem in memories
+            if (min_score <= 0 or mem.relevance_score >= min_score)
+            and (not agent or mem.metadata.get("agent") == agent)
+        )
         if filter_by_mode:
-            memories = self._filter_by_mode(memories)
+            candidates = self._filter_by_mode(candidates)
 
-        # Filter by minimum score
-        if min_score > 0:
-            memories = [m for m in memories if m.relevance_score >= min_score]
-
-        # Limit to requested count
-        return memories[:limit]
+        return list(itertools.islice(candidates, limit))
 
     def get_agent_memories(
         self,
@@ -364,7 +360,7 @@ class ConversationMemoryHandler:
 
         return "\n".join(lines)
 
-    def _filter_by_mode(self, memories: List[MemoryResult]) -> List[MemoryResult]:
+    def _filter_by_mode(self, memories: Iterable[MemoryResult]) -> Iterator[MemoryResult]:
         """Filter memories based on current mode.
 
         Mode filtering rules:
@@ -372,25 +368,25 @@ class ConversationMemoryHandler:
         - PERSONAL mode: returns memories with context in ["personal", "general"]
         - GENERAL mode: returns all memories
 
+        Filtering is lazy, so callers can chain it with other filters and
+        stop early.
+
         Args:
-            memories: List of MemoryResult objects to filter.
+            memories: MemoryResult objects to filter.
 
-        Returns:
-            Filtered list of MemoryResult objects.
+        Yields:
+            MemoryResult objects allowed in the current mode.
         """
         current_mode = get_current_mode()
-        allowed_contexts = MODE_CONTEXTS.get(current_mode, ["work", "personal", "general"])
+        allowed_contexts = MODE_CONTEXTS.get(current_mode, MODE_CONTEXTS[Mode.GENERAL])
 
-        filtered = []
         for mem in memories:
             # Get the context from metadata, default to "general"
             mem_context = mem.metadata.get("context", "general")
 
             # Include if context is in allowed list
             if mem_context in allowed_contexts:
-                filtered.append(mem)
-
-        return filtered
+                yield mem
 
     def clear_session(self, session_id: str, user_id: str) -> int:
         """Clear all memories from a specific session.
@@ -13,7 +13,7 @@ from mem0 import Memory
 from .config import get_config, validate_config
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryResult:
     """Structured memory retrieval result."""
 
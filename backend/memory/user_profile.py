@@ -9,7 +9,7 @@ Single-user design optimized for desktop use.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .memory_service import MemoryService, MemoryResult
 
@@ -27,10 +27,10 @@ class Mode(str, Enum):
 
 
 # Which contexts each mode can access
-MODE_CONTEXTS: Dict[Mode, List[str]] = {
-    Mode.WORK: ["work", "general"],
-    Mode.PERSONAL: ["personal", "general"],
-    Mode.GENERAL: ["work", "personal", "general"],  # Everything
+MODE_CONTEXTS: Dict[Mode, Tuple[str, ...]] = {
+    Mode.WORK: ("work", "general"),
+    Mode.PERSONAL: ("personal", "general"),
+    Mode.GENERAL: ("work", "personal", "general"),  # Everything
 }
 
 
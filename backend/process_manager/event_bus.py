@@ -309,7 +309,7 @@ class EventBus:
             response_types = set(response_types)
 
         # Create pending response tracker
-        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
         pending = PendingResponse(
             correlation_id=event.correlation_id,
             response_types=response_types,
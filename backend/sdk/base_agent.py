@@ -9,6 +9,7 @@ and Workers extend. It implements the agent loop:
 5. Return result
 """
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -21,10 +22,14 @@ from .client import get_sdk_client, SDKClient
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
 def load_prompt(prompts_dir: Path, name: str) -> str:
     """
     Load a system prompt from a prompts directory.
 
+    Prompts are read once per process and cached; agents are created
+    per task, so this keeps prompt files off the hot path.
+
     Args:
         prompts_dir: Path to the prompts directory
         name: Name of the prompt file (without .md extension)
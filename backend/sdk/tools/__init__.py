@@ -12,6 +12,7 @@ from .base import (
     ToolParameter,
     ParameterType,
     ToolRegistry,
+    shared_registry,
 )
 
 # File tools
@@ -83,6 +84,7 @@ __all__ = [
     "ToolParameter",
     "ParameterType",
     "ToolRegistry",
+    "shared_registry",
     # File tools
     "ReadFileTool",
     "WriteFileTool",
@@ -5,10 +5,11 @@ that SDK agents can use. Tools follow the Anthropic API format
 for tool definitions and include input validation.
 """
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional, Union
 
 from pydantic import BaseModel, ValidationError
 
@@ -234,6 +235,7 @@ class ToolRegistry:
     def __init__(self):
         """Initialize an empty registry."""
         self._tools: dict[str, BaseTool] = {}
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] = {}
 
     def register(self, tool: BaseTool) -> None:
         """
@@ -243,6 +245,7 @@ class ToolRegistry:
             tool: The tool instance to register
         """
         self._tools[tool.name] = tool
+        self._handlers.pop(tool.name, None)
         logger.debug(f"Registered tool: {tool.name}")
 
     def unregister(self, name: str) -> None:
@@ -254,6 +257,7 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._handlers.pop(name, None)
             logger.debug(f"Unregistered tool: {name}")
 
     def get(self, name: str) -> Optional[BaseTool]:
@@ -306,11 +310,13 @@ class ToolRegistry:
 
         return await tool.run(input_data)
 
-    def create_handler(self, name: str) -> callable:
+    def create_handler(self, name: str) -> Callable[[dict[str, Any]], Awaitable[str]]:
         """
         Create an async handler function for a tool.
 
-        Useful for registering with BaseAgent.register_tool().
+        Useful for registering with BaseAgent.register_tool(). Handlers
+        are cached, so every agent sharing this registry gets the same
+        object rather than a fresh closure per instance.
 
         Args:
             name: Tool name
@@ -318,7 +324,33 @@ class ToolRegistry:
         Returns:
             Async handler function
         """
-        async def handler(input_data: dict[str, Any]) -> str:
-            return await self.execute(name, input_data)
-
+        handler = self._handlers.get(name)
+        if handler is None:
+            handler = self._handlers[name] = functools.partial(self.execute, name)
         return handler
+
+
+# A tool class, or a (tool class, *constructor args) tuple
+ToolSpec = Union[type[BaseTool], tuple[Any, ...]]
+
+
+@functools.cache
+def shared_registry(tools: tuple[ToolSpec, ...]) -> ToolRegistry:
+    """
+    Get a registry for a fixed tool set, built once per process.
+
+    Agents of the same type list the same tools, and the tools hold no
+    per-agent state, so every instance can share one registry (and its
+    cached handlers) instead of building its own.
+
+    Args:
+        tools: Tool specs, e.g. (ReadFileTool, (RecallTool, "programmer"))
+
+    Returns:
+        The registry shared by every caller passing the same specs
+    """
+    registry = ToolRegistry()
+    for spec in tools:
+        tool_cls, *args = spec if isinstance(spec, tuple) else (spec,)
+        registry.register(tool_cls(*args))
+    return registry
@@ -10,14 +10,32 @@ These tools integrate with the Part 9 memory system:
 - Uses semantic search for intelligent retrieval
 """
 
+import asyncio
 from typing import Any, Optional, List
 
 from config import get_logger
 from .base import BaseTool, ToolParameter, ParameterType
 
+# Bind the memory API once at import; the tools report a clear error
+# at call time if the memory system (mem0) is not installed.
+try:
+    from memory import add_memory, search_memory, get_agent_memories, get_memory_service
+    from memory.user_profile import DEFAULT_USER_ID
+except ImportError:
+    add_memory = search_memory = get_agent_memories = get_memory_service = None
+    DEFAULT_USER_ID = None
+
 logger = get_logger(__name__)
 
 
+def _require_memory() -> None:
+    """Raise if the memory system could not be imported."""
+    if add_memory is None:
+        raise RuntimeError(
+            "Memory system unavailable: install the memory dependencies (mem0ai)"
+        )
+
+
 class RememberTool(BaseTool):
     """Store information in long-term memory using mem0."""
 
@@ -78,13 +96,14 @@ class RememberTool(BaseTool):
         Returns:
             Confirmation message with memory details
         """
-        # Import here to avoid circular imports
-        from memory import add_memory
+        _require_memory()
 
         logger.debug(f"Agent '{self.agent_name}' remembering: {content[:50]}...")
 
         try:
-            result = add_memory(
+            # mem0 embeds and persists synchronously; keep it off the event loop
+            result = await asyncio.to_thread(
+                add_memory,
                 content=content,
                 context=context,
                 category=category,
@@ -114,6 +133,38 @@ class RememberTool(BaseTool):
             return f"Failed to store memory: {str(e)}"
 
 
+def _format_memory_lines(
+    index: int,
+    content: str,
+    score: float,
+    metadata: dict[str, Any],
+) -> list[str]:
+    """Format a single recalled memory as output lines."""
+    agent = metadata.get("agent", "user")
+    category = metadata.get("category", "general")
+
+    lines = [f"{index}. [{category}] (from: {agent})", f"   {content}"]
+    if score > 0:
+        lines.append(f"   Relevance: {score:.0%}")
+    lines.append("")
+    return lines
+
+
+def _format_result_obj(index: int, mem: Any) -> list[str]:
+    """Format a MemoryResult object."""
+    return _format_memory_lines(index, mem.content, mem.relevance_score, mem.metadata or {})
+
+
+def _format_result_dict(index: int, mem: dict[str, Any]) -> list[str]:
+    """Format a raw mem0 result dict."""
+    return _format_memory_lines(
+        index,
+        mem.get("memory", mem.get("content", str(mem))),
+        mem.get("score") or 0.0,
+        mem.get("metadata") or {},
+    )
+
+
 class RecallTool(BaseTool):
     """Retrieve relevant memories using semantic search."""
 
@@ -172,7 +223,7 @@ class RecallTool(BaseTool):
         Returns:
             Formatted list of relevant memories
         """
-        from memory import search_memory, get_agent_memories
+        _require_memory()
 
         logger.debug(f"Agent '{self.agent_name}' recalling: {query}")
 
@@ -196,25 +247,10 @@ class RecallTool(BaseTool):
             # Format results
             lines = [f"Found {len(results)} relevant memories:", ""]
 
+            # A single call returns one format, so pick the formatter once
+            fmt = _format_result_obj if hasattr(results[0], "content") else _format_result_dict
             for i, mem in enumerate(results, 1):
-                # Handle both MemoryResult objects and dicts
-                if hasattr(mem, "content"):
-                    content = mem.content
-                    score = getattr(mem, "relevance_score", 0.0)
-                    metadata = getattr(mem, "metadata", {})
-                else:
-                    content = mem.get("memory", mem.get("content", str(mem)))
-                    score = mem.get("score", 0.0)
-                    metadata = mem.get("metadata", {})
-
-                agent = metadata.get("agent", "user")
-                category = metadata.get("category", "general")
-
-                lines.append(f"{i}. [{category}] (from: {agent})")
-                lines.append(f"   {content}")
-                if score > 0:
-                    lines.append(f"   Relevance: {score:.0%}")
-                lines.append("")
+                lines.extend(fmt(i, mem))
 
             return "\n".join(lines)
 
@@ -255,7 +291,7 @@ class ForgetTool(BaseTool):
         Returns:
             Confirmation or error message
         """
-        from memory import get_memory_service
+        _require_memory()
 
         logger.debug(f"Agent '{self.agent_name}' forgetting: {memory_id}")
 
@@ -318,8 +354,7 @@ class ListMemoriesTool(BaseTool):
         Returns:
             Formatted list of memories
         """
-        from memory import get_memory_service
-        from memory.user_profile import DEFAULT_USER_ID
+        _require_memory()
 
         logger.debug(f"Agent '{self.agent_name}' listing memories")
 
@@ -336,26 +371,21 @@ class ListMemoriesTool(BaseTool):
             else:
                 memories = all_memories
 
-            # Filter by agent if specified
-            if agent_filter:
-                memories = [
-                    m for m in memories
-                    if m.get("metadata", {}).get("agent") == agent_filter
-                ]
+            # Filter by agent and organize in a single pass
+            by_agent: dict[str, list] = {}
+            total = 0
+            for mem in memories:
+                agent = (mem.get("metadata") or {}).get("agent")
+                if agent_filter and agent != agent_filter:
+                    continue
+                by_agent.setdefault(agent or "user", []).append(mem)
+                total += 1
 
-            if not memories:
+            if not total:
                 if agent_filter:
                     return f"No memories found from agent: {agent_filter}"
                 return "No memories stored yet."
 
-            # Organize by agent
-            by_agent: dict[str, list] = {}
-            for mem in memories:
-                agent = mem.get("metadata", {}).get("agent", "user")
-                if agent not in by_agent:
-                    by_agent[agent] = []
-                by_agent[agent].append(mem)
-
             # Format output
             lines = ["Stored Memories:", ""]
 
@@ -379,7 +409,6 @@ class ListMemoriesTool(BaseTool):
                 if count >= limit:
                     break
 
-            total = len(memories)
             lines.append(f"Total: {total} memories from {len(by_agent)} agents")
 
             return "\n".join(lines)
@@ -5,17 +5,411 @@ Used by Research Lead, Code Lead, and other agents that need search capabilities
 """
 
 import asyncio
+import bisect
+import fnmatch
+import functools
+import heapq
+import itertools
+import os
 import re
 import shutil
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Protocol
 
 from config import settings, get_logger
 from .base import BaseTool, ToolParameter, ParameterType
 
+# Optional: .gitignore support for the Python grep fallback
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
+# Optional: vectorized newline indexing for the Python grep fallback
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: linear-time RE2 engine (google-re2) for the Python grep fallback
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = get_logger(__name__)
 
 
+# ripgrep executable, resolved once at import (see refresh_rg_path)
+_RG_PATH: Optional[str] = shutil.which("rg")
+
+# Directory listing cache shared by glob/grep walks:
+# path -> ((st_mtime_ns, st_ino), ((name, is_dir, is_file), ...))
+_DIR_CACHE: OrderedDict[str, tuple[tuple[int, int], tuple[tuple[str, bool, bool, bool], ...]]] = OrderedDict()
+_DIR_CACHE_MAX = 2048
+_DIR_CACHE_LOCK = threading.Lock()
+
+# Listings of directories modified this recently are not cached: with
+# coarse mtimes (1 s on HFS+, 2 s on FAT) an entry added in the same tick
+# would leave the mtime unchanged (git's "racy" index entries)
+_DIR_CACHE_RACY_NS = 2_000_000_000
+
+# Extensions of files that are never searched by the Python grep fallback
+_BINARY_EXTS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".icns", ".webp", ".tiff",
+    ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".tar", ".rar", ".jar",
+    ".so", ".dylib", ".dll", ".exe", ".o", ".a", ".lib", ".bin", ".rlib",
+    ".pyc", ".pyo", ".class", ".wasm",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".mp3", ".mp4", ".wav", ".ogg", ".webm", ".flac", ".mov", ".avi",
+    ".sqlite", ".sqlite3", ".db", ".pt", ".pth", ".onnx", ".npy", ".npz",
+})
+
+# Leading bytes checked for NUL to detect binary files
+_BINARY_SNIFF_BYTES = 8192
+
+# Longest matching line ripgrep prints in full; longer lines are previewed
+_RG_MAX_COLUMNS = 1000
+
+# Maximum files scanned concurrently by the Python grep fallback
+_PYTHON_GREP_CONCURRENCY = 16
+
+# Matches beyond max_results are still counted, up to this multiple of
+# it, so truncated results can report how many more there are
+_GREP_COUNT_FACTOR = 4
+
+
+def refresh_rg_path() -> Optional[str]:
+    """
+    Re-resolve the ripgrep executable on PATH.
+
+    Returns:
+        Path to rg, or None if it is not installed
+    """
+    global _RG_PATH
+    _RG_PATH = shutil.which("rg")
+    return _RG_PATH
+
+
+def _scandir_cached(path: str) -> tuple[tuple[str, bool, bool, bool], ...]:
+    """
+    List a directory, reusing the previous listing if it is unchanged.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed, so one stat call validates the cached listing. Directories
+    changed within the last couple of seconds are listed every time,
+    since a later change in the same mtime tick would go unnoticed.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        (name, is_dir, is_file, is_symlink) for each entry; is_dir and
+        is_file follow symlinks, as Path.is_dir()/is_file() do
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    st = os.stat(path)
+    version = (st.st_mtime_ns, st.st_ino)
+
+    with _DIR_CACHE_LOCK:
+        cached = _DIR_CACHE.get(path)
+        if cached is not None and cached[0] == version:
+            _DIR_CACHE.move_to_end(path)
+            return cached[1]
+
+    with os.scandir(path) as it:
+        entries = tuple(
+            (entry.name, entry.is_dir(), entry.is_file(), entry.is_symlink())
+            for entry in it
+        )
+
+    if time.time_ns() - st.st_mtime_ns < _DIR_CACHE_RACY_NS:
+        return entries
+
+    with _DIR_CACHE_LOCK:
+        _DIR_CACHE[path] = (version, entries)
+        _DIR_CACHE.move_to_end(path)
+        if len(_DIR_CACHE) > _DIR_CACHE_MAX:
+            _DIR_CACHE.popitem(last=False)
+
+    return entries
+
+
+@functools.lru_cache(maxsize=64)
+def _load_gitignore(root: str, mtime_ns: int) -> Optional[Any]:
+    """Parse root/.gitignore; mtime_ns keys the cache so edits are picked up."""
+    with open(os.path.join(root, ".gitignore"), "r", encoding="utf-8", errors="ignore") as f:
+        return pathspec.GitIgnoreSpec.from_lines(f)
+
+
+def _gitignore_spec(root: str) -> Optional[Any]:
+    """
+    Get the .gitignore rules at the root of a search, if any.
+
+    Returns None when pathspec is not installed or there is no
+    readable .gitignore.
+    """
+    if pathspec is None:
+        return None
+    try:
+        mtime_ns = os.stat(os.path.join(root, ".gitignore")).st_mtime_ns
+        return _load_gitignore(root, mtime_ns)
+    except (OSError, ValueError):
+        return None
+
+
+class _Regex(Protocol):
+    """A compiled pattern from either the re or the re2 module."""
+
+    def search(self, string: Any, pos: int = ..., endpos: int = ...) -> Optional[Any]:
+        ...
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_regex(pattern: str | bytes, flags: int) -> _Regex:
+    """Compile a regex once and reuse it across searches (RE2 for bytes when available)."""
+    if re2 is not None and isinstance(pattern, bytes):
+        # RE2 takes flags inline; it rejects backreferences and lookaround,
+        # in which case the backtracking re engine is used instead
+        options = re2.Options()
+        options.log_errors = False
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(b"(?m)" + pattern if flags & re.MULTILINE else pattern, options)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# File size units for GlobTool output, in steps of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Characters that make a glob segment a wildcard rather than a literal name
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> tuple[Optional[re.Pattern], ...]:
+    """
+    Compile a glob into per-segment matchers.
+
+    Each path segment becomes a compiled fnmatch regex; "**" segments
+    become None and match any number of directories.
+    """
+    return tuple(
+        None if segment == "**" else re.compile(fnmatch.translate(segment))
+        for segment in pattern.split("/")
+        if segment and segment != "."
+    )
+
+
+def _open_hinted(path: str):
+    """
+    Open a file for a single front-to-back read.
+
+    Where supported, tells the kernel the file will be read sequentially
+    so it can use aggressive readahead.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return os.fdopen(fd, "rb")
+
+
+class _GlobTree:
+    """
+    Incremental matcher for a segmented glob pattern.
+
+    Tracks which pattern segments are still reachable at the current
+    directory depth. Descending into a directory advances the state by
+    one path segment, so subtrees where no segment can match are never
+    listed.
+    """
+
+    __slots__ = ("segments", "positions")
+
+    def __init__(self, segments: tuple[Optional[re.Pattern], ...], positions: frozenset[int]):
+        self.segments = segments
+        self.positions = positions
+
+    @classmethod
+    def compile(cls, pattern: str) -> "_GlobTree":
+        """Build the root matcher state for a glob pattern."""
+        segments = _compile_glob(pattern)
+        return cls(segments, cls._closure(segments, {0}))
+
+    @staticmethod
+    def _closure(segments: tuple[Optional[re.Pattern], ...], positions: set[int]) -> frozenset[int]:
+        """Add the positions reachable by letting "**" match zero segments."""
+        stack = list(positions)
+        while stack:
+            pos = stack.pop()
+            if pos < len(segments) and segments[pos] is None and pos + 1 not in positions:
+                positions.add(pos + 1)
+                stack.append(pos + 1)
+        return frozenset(positions)
+
+    def _advance(self, name: str, recursive: bool = True) -> frozenset[int]:
+        """
+        Positions reachable after consuming one path segment.
+
+        With recursive=False a "**" may not absorb the segment, so only
+        explicit segment matches advance (see match_dir).
+        """
+        segments = self.segments
+        next_positions: set[int] = set()
+        for pos in self.positions:
+            if pos == len(segments):
+                continue
+            segment = segments[pos]
+            if segment is None:
+                if recursive:
+                    next_positions.add(pos)
+            elif segment.match(name):
+                next_positions.add(pos + 1)
+        return self._closure(segments, next_positions) if next_positions else frozenset()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the path consumed so far matches the whole pattern."""
+        return len(self.segments) in self.positions
+
+    @property
+    def can_descend(self) -> bool:
+        """Whether entries below the current directory can still match."""
+        return any(pos < len(self.segments) for pos in self.positions)
+
+    def match_dir(self, name: str, recursive: bool = True) -> Optional["_GlobTree"]:
+        """
+        Advance into a directory; None if nothing at or below it can match.
+
+        Pass recursive=False for symlinked directories: like Path.glob,
+        "**" does not recurse through symlinks, but an explicit segment
+        can still match one.
+        """
+        positions = self._advance(name, recursive)
+        return _GlobTree(self.segments, positions) if positions else None
+
+    def match_file(self, name: str) -> bool:
+        """Check whether a file with this name completes the pattern."""
+        return len(self.segments) in self._advance(name)
+
+
+def _walk_glob(
+    root: str,
+    pattern: str,
+    ignore: Optional[Any] = None,
+) -> Iterator[tuple[str, bool, bool, str]]:
+    """
+    Walk a directory tree and yield entries matching a glob pattern.
+
+    Hidden files and directories are skipped without descending into
+    them, so trees like .git or .venv are never read. Directories are
+    only entered when the remaining pattern can match below them, and
+    "**" does not recurse into symlinked directories (as in Path.glob).
+
+    Args:
+        root: Directory to search
+        pattern: Glob pattern relative to root (supports "**")
+        ignore: Optional pathspec of ignore rules relative to root;
+            ignored directories are not descended into
+
+    Yields:
+        (relative path, is_dir, is_file, full path) for each match
+    """
+    parts = [part for part in pattern.split("/") if part and part != "."]
+
+    # Descend directly into the literal (wildcard-free) leading segments
+    # instead of walking their siblings. The last segment always stays a
+    # matcher so the final entry comes from a directory listing.
+    literal: list[str] = []
+    for part in parts[:-1]:
+        if part == "**" or _GLOB_MAGIC.search(part):
+            break
+        literal.append(part)
+
+    if any(part.startswith(".") for part in literal):
+        return
+
+    tree = _GlobTree.compile("/".join(parts[len(literal):]))
+    # A trailing "**" or "/" matches directories only, as in Path.glob
+    dirs_only = pattern.endswith("/") or (bool(tree.segments) and tree.segments[-1] is None)
+
+    prefix = "".join(f"{part}/" for part in literal)
+    start = os.path.join(root, *literal)
+
+    # A pattern ending in "**" also matches the directory it starts
+    # from ("src/**" yields "src", "**" yields ".")
+    if dirs_only and tree.complete and os.path.isdir(start):
+        rel_start = prefix.rstrip("/") or "."
+        if ignore is None or rel_start == "." or not ignore.match_file(f"{rel_start}/"):
+            yield rel_start, True, False, start
+
+    stack = [(prefix, start, tree)]
+    while stack:
+        rel_dir, dir_path, state = stack.pop()
+        try:
+            entries = _scandir_cached(dir_path)
+        except (PermissionError, OSError):
+            continue
+
+        for name, is_dir, is_file, is_link in entries:
+            if name.startswith("."):
+                continue
+
+            if is_dir:
+                child = state.match_dir(name, recursive=not is_link)
+                if child is None:
+                    continue
+
+                rel_path = f"{rel_dir}{name}"
+                if ignore is not None and ignore.match_file(f"{rel_path}/"):
+                    continue
+                full_path = os.path.join(dir_path, name)
+                if child.can_descend:
+                    stack.append((f"{rel_path}/", full_path, child))
+                if child.complete:
+                    yield rel_path, True, False, full_path
+
+            elif not dirs_only and state.match_file(name):
+                rel_path = f"{rel_dir}{name}"
+                if ignore is not None and ignore.match_file(rel_path):
+                    continue
+                yield rel_path, False, is_file, os.path.join(dir_path, name)
+
+
+def _iter_files(root: str, file_pattern: str) -> Iterator[tuple[str, str]]:
+    """
+    Recursively yield files under root whose name matches a glob.
+
+    Equivalent to Path.rglob(file_pattern) restricted to regular,
+    non-hidden files, but hidden directories are pruned during the walk
+    and entry types come from the (cached) directory listing instead of
+    extra stat calls. Files with known binary extensions are skipped,
+    and, like ripgrep, so are paths matched by the root .gitignore when
+    pathspec is installed.
+
+    Args:
+        root: Directory to search
+        file_pattern: Glob pattern for file names (e.g. "*.py")
+
+    Yields:
+        (full path, path relative to root) as strings
+    """
+    ignore = _gitignore_spec(root)
+    for rel_path, _, is_file, full_path in _walk_glob(root, f"**/{file_pattern or '*'}", ignore):
+        if is_file and os.path.splitext(full_path)[1].lower() not in _BINARY_EXTS:
+            yield full_path, rel_path
+
+
 class GrepTool(BaseTool):
     """Search for a pattern in files."""
 
@@ -88,8 +482,7 @@ class GrepTool(BaseTool):
         logger.debug(f"Grep search: '{pattern}' in {path}")
 
         # Try to use ripgrep if available (faster)
-        rg_path = shutil.which("rg")
-        if rg_path:
+        if _RG_PATH:
             return await self._search_with_ripgrep(
                 pattern, search_path, file_pattern, case_sensitive, max_results
             )
@@ -108,7 +501,19 @@ class GrepTool(BaseTool):
         max_results: int,
     ) -> str:
         """Use ripgrep for fast searching."""
-        cmd = ["rg", "--line-number", "--no-heading", "--color=never"]
+        cmd = [
+            _RG_PATH,
+            "--line-number",
+            "--no-heading",
+            "--color=never",
+            "--no-messages",
+            "--no-require-git",
+            "--threads", str(os.cpu_count() or 4),
+            # Cap very long lines (e.g. minified files) so output stays
+            # small and each line fits the stream reader's buffer
+            "--max-columns", str(_RG_MAX_COLUMNS),
+            "--max-columns-preview",
+        ]
 
         if not case_sensitive:
             cmd.append("-i")
@@ -116,7 +521,9 @@ class GrepTool(BaseTool):
         if file_pattern != "*":
             cmd.extend(["-g", file_pattern])
 
-        cmd.extend(["-m", str(max_results), pattern, str(path)])
+        # rg's -m caps matches per file; max_results is a global cap, so it
+        # is enforced while streaming the output below
+        cmd.extend(["-e", pattern, str(path)])
 
         try:
             process = await asyncio.create_subprocess_exec(
@@ -124,29 +531,64 @@ class GrepTool(BaseTool):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=30,
+        except OSError as e:
+            logger.warning(f"ripgrep failed to start: {e}")
+            return await self._search_with_python(
+                pattern, path, file_pattern, case_sensitive, max_results
             )
 
-            if process.returncode == 0:
-                output = stdout.decode("utf-8", errors="replace")
-                lines = output.strip().split("\n")
-                return self._format_results(lines, pattern, max_results)
-            elif process.returncode == 1:
-                # No matches found
-                return f"No matches found for pattern: {pattern}"
-            else:
-                # Error occurred, fall back to Python
-                logger.warning(f"ripgrep error: {stderr.decode()}")
-                return await self._search_with_python(
-                    pattern, path, file_pattern, case_sensitive, max_results
-                )
+        # Drain stderr separately so a chatty stderr cannot stall stdout
+        stderr_task = asyncio.create_task(process.stderr.read())
+        lines: list[str] = []
+        total_found = 0
+        ceiling = max_results * _GREP_COUNT_FACTOR
+
+        async def read_matches() -> None:
+            nonlocal total_found
+            # Stream matches so memory stays bounded by max_results; later
+            # matches are only counted
+            async for raw in process.stdout:
+                if total_found < max_results:
+                    lines.append(raw.decode("utf-8", errors="replace").rstrip())
+                total_found += 1
+                if total_found >= ceiling:
+                    break
 
+        try:
+            await asyncio.wait_for(read_matches(), timeout=30)
         except asyncio.TimeoutError:
+            self._stop_process(process)
+            await process.wait()
+            stderr_task.cancel()
             return "Search timed out after 30 seconds"
 
+        # Stop ripgrep early if it still has output we don't need
+        if total_found >= ceiling:
+            self._stop_process(process)
+        await process.wait()
+        stderr = await stderr_task
+
+        if lines:
+            return self._format_results(lines, pattern, max_results, total_found)
+        elif process.returncode in (0, 1):
+            # No matches found
+            return f"No matches found for pattern: {pattern}"
+        else:
+            # Error occurred, fall back to Python
+            logger.warning(f"ripgrep error: {stderr.decode(errors='replace')}")
+            return await self._search_with_python(
+                pattern, path, file_pattern, case_sensitive, max_results
+            )
+
+    @staticmethod
+    def _stop_process(process: asyncio.subprocess.Process) -> None:
+        """Terminate a subprocess if it is still running."""
+        if process.returncode is None:
+            try:
+                process.terminate()
+            except ProcessLookupError:
+                pass
+
     async def _search_with_python(
         self,
         pattern: str,
@@ -156,66 +598,188 @@ class GrepTool(BaseTool):
         max_results: int,
     ) -> str:
         """Python fallback for grep functionality."""
-        flags = 0 if case_sensitive else re.IGNORECASE
+        # Whole files are scanned at once, so anchors must match per line
+        flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
 
         try:
-            regex = re.compile(pattern, flags)
+            regex = _compiled_regex(pattern.encode("utf-8"), flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
 
-        results = []
+        results: list[str] = []
+        total_found = 0
+        ceiling = max_results * _GREP_COUNT_FACTOR
 
-        # Get files to search
+        # Get files to search (hidden files and directories are skipped)
         if path.is_file():
-            files = [path]
+            files = [(str(path), path.name)]
         else:
-            files = list(path.rglob(file_pattern))
-
-        # Filter out binary files and hidden files
-        files = [
-            f for f in files
-            if f.is_file()
-            and not f.name.startswith(".")
-            and not any(part.startswith(".") for part in f.parts)
-        ]
+            files = list(_iter_files(str(path), file_pattern))
+
+        # A fixed pool of workers scans files in threads so the blocking
+        # reads overlap and the event loop stays free. Results are stored
+        # by file index and merged in walk order, so the output (and what
+        # the cap cuts off) is the same on every run.
+        scanned: list[Optional[tuple[list[str], int]]] = [None] * len(files)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for idx in range(len(files)):
+            queue.put_nowait(idx)
+        merged = 0
+
+        async def worker() -> None:
+            nonlocal merged, total_found
+            while total_found < ceiling:
+                try:
+                    idx = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                file_path, rel_path = files[idx]
+                try:
+                    scanned[idx] = await asyncio.to_thread(
+                        self._scan_file,
+                        file_path,
+                        regex,
+                        rel_path,
+                        ceiling - total_found,
+                        max_results - len(results),
+                    )
+                except (PermissionError, OSError):
+                    scanned[idx] = ([], 0)
+
+                # Merge the finished prefix of the walk
+                while merged < len(files) and scanned[merged] is not None and total_found < ceiling:
+                    found, count = scanned[merged]
+                    scanned[merged] = ([], 0)
+                    results.extend(found[:max_results - len(results)])
+                    total_found += count
+                    merged += 1
+
+        await asyncio.gather(*(worker() for _ in range(min(_PYTHON_GREP_CONCURRENCY, len(files)))))
+
+        return self._format_results(results, pattern, max_results, total_found)
+
+    @staticmethod
+    def _scan_file(
+        file_path: str,
+        regex: _Regex,
+        display_path: str,
+        limit: int,
+        keep: int,
+    ) -> tuple[list[str], int]:
+        """
+        Scan a whole file with a bytes regex.
+
+        The file is read whole and searched in one pass by the regex
+        engine to find candidate lines; line numbers are recovered from a
+        newline offset index. Since a buffer-wide match may run across
+        newlines, each candidate line is searched again on its own, with
+        one trailing carriage return removed, so results match a
+        line-by-line grep. Files containing carriage returns are checked
+        line by line throughout, as "$" does not match before CRLF in the
+        buffer-wide pass.
+        Each matching line is reported once.
+
+        Args:
+            file_path: File to scan
+            regex: Compiled bytes pattern (with re.MULTILINE)
+            display_path: Path to show in results
+            limit: Maximum matching lines to count
+            keep: Maximum matching lines to format and return
 
-        for file_path in files:
-            if len(results) >= max_results:
+        Returns:
+            Tuple of result lines formatted as "path:line:text" and the
+            number of matching lines counted
+        """
+        results: list[str] = []
+        count = 0
+
+        # Read into memory rather than mmap: a file truncated by another
+        # tool mid-scan would raise SIGBUS on the mapped pages and kill
+        # the whole process, where a read just sees the shorter file
+        with _open_hinted(file_path) as f:
+            data = f.read()
+
+        # Skip binary files, detected by a NUL byte near the start
+        if data.find(b"\x00", 0, _BINARY_SNIFF_BYTES) != -1:
+            return results, count
+
+        size = len(data)
+
+        # Newline offset index, built once per file; matches are
+        # mapped to line numbers by binary search
+        if np is not None:
+            newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10)
+            line_of = functools.partial(np.searchsorted, newlines)
+        else:
+            newlines = []
+            idx = data.find(b"\n")
+            while idx != -1:
+                newlines.append(idx)
+                idx = data.find(b"\n", idx + 1)
+            line_of = functools.partial(bisect.bisect_left, newlines)
+
+        every_line = data.find(b"\r") != -1
+
+        pos = 0
+        while pos < size and count < limit:
+            if every_line:
+                candidate = pos
+            else:
+                match = regex.search(data, pos)
+                if match is None:
+                    break
+                candidate = match.start()
+
+            line_idx = int(line_of(candidate))
+            line_start = int(newlines[line_idx - 1]) + 1 if line_idx else 0
+            if line_start >= size:
                 break
+            line_end = int(newlines[line_idx]) if line_idx < len(newlines) else size
 
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    for line_num, line in enumerate(f, 1):
-                        if regex.search(line):
-                            rel_path = file_path.relative_to(path) if path.is_dir() else file_path.name
-                            results.append(f"{rel_path}:{line_num}:{line.rstrip()}")
-                            if len(results) >= max_results:
-                                break
-            except (PermissionError, OSError):
-                continue
+            line = data[line_start:line_end]
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if regex.search(line) is not None:
+                if count < keep:
+                    text = line.decode("utf-8", errors="ignore").rstrip()
+                    results.append(f"{display_path}:{line_idx + 1}:{text}")
+                count += 1
 
-        return self._format_results(results, pattern, max_results)
+            # Resume after this line so each line is reported once
+            pos = line_end + 1
+
+        return results, count
 
     def _format_results(
         self,
         lines: list[str],
         pattern: str,
         max_results: int,
+        total: Optional[int] = None,
     ) -> str:
         """Format search results."""
         if not lines or (len(lines) == 1 and not lines[0]):
             return f"No matches found for pattern: {pattern}"
 
+        if total is None:
+            total = len(lines)
+
         output = [f"Search results for: {pattern}", ""]
 
-        for line in lines[:max_results]:
+        for line in itertools.islice(lines, max_results):
             if line:
                 output.append(line)
 
-        if len(lines) >= max_results:
+        if total > max_results:
             output.append(f"\n... (showing first {max_results} results)")
 
-        output.append(f"\nTotal: {len(lines)} matches")
+        # Counting stops at the ceiling, so the exact total is unknown
+        ceiling = max_results * _GREP_COUNT_FACTOR
+        if total >= ceiling:
+            output.append(f"\nTotal: {ceiling}+ matches")
+        else:
+            output.append(f"\nTotal: {total} matches")
 
         return "\n".join(output)
 
@@ -278,28 +842,23 @@ class GlobTool(BaseTool):
 
         logger.debug(f"Glob search: '{pattern}' in {path}")
 
-        # Find matching files
-        matches = list(search_path.glob(pattern))
-
-        # Filter out hidden files
-        matches = [
-            m for m in matches
-            if not m.name.startswith(".")
-            and not any(part.startswith(".") for part in m.parts)
-        ]
+        # Find matching files, pruning hidden directories during the walk
+        matches = list(_walk_glob(str(search_path), pattern))
 
-        # Sort by path
-        matches = sorted(matches, key=lambda x: str(x).lower())
+        # Only the shown entries need ordering and a stat call
+        shown = heapq.nsmallest(max_results, matches, key=lambda match: match[0].lower())
 
         # Format output
         lines = [f"Files matching: {pattern}", ""]
 
-        for match in matches[:max_results]:
-            rel_path = match.relative_to(search_path)
-            if match.is_dir():
+        for rel_path, is_dir, _, full_path in shown:
+            if is_dir:
                 lines.append(f"📁 {rel_path}/")
             else:
-                size = match.stat().st_size
+                try:
+                    size = os.stat(full_path).st_size
+                except OSError:
+                    size = 0
                 lines.append(f"📄 {rel_path} ({self._format_size(size)})")
 
         if len(matches) > max_results:
@@ -311,11 +870,11 @@ class GlobTool(BaseTool):
 
     def _format_size(self, size: int) -> str:
         """Format file size."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        # Each unit step is 2**10, so the unit follows from the bit length
+        idx = min(len(_SIZE_UNITS) - 1, max(0, (size.bit_length() - 1) // 10))
+        if idx == 0:
+            return f"{size} B"
+        return f"{size / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 # =============================================================================
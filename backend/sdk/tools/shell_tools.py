@@ -7,13 +7,21 @@ IMPORTANT: Dangerous commands require user approval before execution.
 """
 
 import asyncio
+import errno
 import re
 import shlex
+from collections import OrderedDict
 from typing import Any, Callable, Optional
 
 from config import settings, get_logger
 from .base import BaseTool, ToolParameter, ParameterType
 
+# Optional: linear-time RE2 engine (google-re2) for the dangerous-pattern scan
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = get_logger(__name__)
 
 
@@ -70,6 +78,44 @@ DANGEROUS_PATTERNS = [
     r"\bssh\b.*rm\b",
 ]
 
+
+def _compile_dangerous(pattern: str) -> re.Pattern:
+    """Compile the fused dangerous pattern, with RE2 when available."""
+    if re2 is not None:
+        # RE2 scans the whole alternation in one linear pass instead of
+        # retrying each branch at every position
+        options = re2.Options()
+        options.log_errors = False
+        options.case_sensitive = False
+        try:
+            return re2.compile(pattern, options)
+        except Exception:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# All dangerous patterns fused into one regex, so a single search
+# decides whether a command is dangerous
+_DANGEROUS_RE = _compile_dangerous("|".join(f"(?:{p})" for p in DANGEROUS_PATTERNS))
+
+# The individual patterns, for picking the reason: the fused search finds
+# the leftmost match in the command, but the reported pattern is the
+# first one in DANGEROUS_PATTERNS order that matches
+_DANGEROUS_EACH = tuple(re.compile(p, re.IGNORECASE) for p in DANGEROUS_PATTERNS)
+
+# Literal substrings at least one of which every dangerous pattern needs;
+# commands containing none of them skip the regex entirely
+_DANGER_TRIGGERS = (
+    "rm", "mkfs", "dd", "format",
+    "su", "doas",
+    "chmod", "chown", "chgrp",
+    "systemctl", "service", "kill",
+    "iptables", "firewall",
+    ">",
+    "apt", "yum", "brew", "pip", "npm",
+    "git", "ssh",
+)
+
 # Commands that are always blocked
 BLOCKED_COMMANDS = [
     "shutdown",
@@ -81,6 +127,9 @@ BLOCKED_COMMANDS = [
     ":(){ :|:& };:",  # Fork bomb
 ]
 
+# Blocked commands as one case-insensitive literal alternation
+_BLOCKED_RE = re.compile("|".join(map(re.escape, BLOCKED_COMMANDS)), re.IGNORECASE)
+
 # Safe command prefixes (don't require approval)
 SAFE_PREFIXES = [
     "echo",
@@ -120,6 +169,64 @@ SAFE_PREFIXES = [
     "git remote -v",
 ]
 
+# Safe prefixes indexed by first word: single-word commands are safe by
+# that word alone, multi-word ones are grouped for a prefix check
+_SAFE_COMMANDS = frozenset(s for s in SAFE_PREFIXES if " " not in s)
+_SAFE_MULTIWORD: dict[str, tuple[str, ...]] = {}
+for _prefix in SAFE_PREFIXES:
+    if " " in _prefix:
+        _first = _prefix.split(None, 1)[0]
+        _SAFE_MULTIWORD[_first] = _SAFE_MULTIWORD.get(_first, ()) + (_prefix,)
+del _prefix, _first
+
+# Characters that need a shell (operators, quoting, expansion,
+# redirection, assignment); commands without any are exec'd directly
+_SHELL_META = frozenset("|&;<>()$`\\\"'*?[]{}#~=%!\n")
+
+# Output limits: each stream keeps at most _STREAM_CAP bytes while the
+# rest is drained and discarded, so memory stays bounded however much a
+# command prints; the formatted result is cut at _MAX_OUTPUT characters
+_MAX_OUTPUT = 50000
+_STREAM_CAP = _MAX_OUTPUT
+_READ_CHUNK = 65536
+
+# Background process tracking: at most _MAX_BACKGROUND running at once,
+# and the last _MAX_FINISHED exited ones kept (oldest dropped first) so
+# their exit status can still be read
+_MAX_BACKGROUND = 32
+_MAX_FINISHED = 64
+
+
+def _fast_decode(data: bytes | bytearray) -> str:
+    """Decode command output, skipping UTF-8 validation for pure ASCII."""
+    if data.isascii():
+        return data.decode("ascii")
+    return data.decode("utf-8", errors="replace")
+
+
+async def _read_capped(stream: asyncio.StreamReader, buf: bytearray, limit: int) -> int:
+    """
+    Read a stream to EOF, keeping at most limit bytes.
+
+    Args:
+        stream: Stream to drain
+        buf: Buffer receiving the kept bytes (filled in place, so partial
+            output survives cancellation)
+        limit: Maximum bytes to keep
+
+    Returns:
+        Total bytes read from the stream
+    """
+    total = 0
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            return total
+        total += len(chunk)
+        room = limit - len(buf)
+        if room > 0:
+            buf += chunk[:room]
+
 
 # Type for approval callback
 ApprovalCallback = Callable[[str, str], asyncio.Future[bool]]
@@ -169,11 +276,6 @@ class ExecuteCommandTool(BaseTool):
         ),
     ]
 
-    def __init__(self):
-        """Initialize the tool."""
-        super().__init__()
-        self._dangerous_patterns = [re.compile(p, re.IGNORECASE) for p in DANGEROUS_PATTERNS]
-
     async def execute(
         self,
         command: str,
@@ -219,58 +321,103 @@ class ExecuteCommandTool(BaseTool):
         logger.debug(f"Executing command: {command}")
 
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir,
-            )
+            process = await self._spawn(command, working_dir)
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
+            # Stream both pipes into bounded buffers
+            stdout = bytearray()
+            stderr = bytearray()
 
-            # Decode output
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
-
-            # Format result
-            result_parts = []
-
-            if stdout_str:
-                result_parts.append(f"STDOUT:\n{stdout_str}")
+            try:
+                stdout_total, stderr_total, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_capped(process.stdout, stdout, _STREAM_CAP),
+                        _read_capped(process.stderr, stderr, _STREAM_CAP),
+                        process.wait(),
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                if process.returncode is None:
+                    process.kill()
+                await process.wait()
+
+                message = f"Command timed out after {timeout} seconds: {command}"
+                partial = _fast_decode(stdout)
+                if partial:
+                    message += f"\n\nPartial output:\n{partial[:_MAX_OUTPUT]}"
+                return message
 
-            if stderr_str:
-                result_parts.append(f"STDERR:\n{stderr_str}")
+            # Decode output
+            stdout_str = _fast_decode(stdout)
+            stderr_str = _fast_decode(stderr)
 
-            result_parts.append(f"\nExit code: {process.returncode}")
+            if stdout_total > len(stdout):
+                stdout_str += f"\n... (truncated, {stdout_total} bytes total)"
+            if stderr_total > len(stderr):
+                stderr_str += f"\n... (truncated, {stderr_total} bytes total)"
 
-            result = "\n".join(result_parts)
+            # Format result
+            returncode = process.returncode
+            if stdout_str and stderr_str:
+                result = f"STDOUT:\n{stdout_str}\nSTDERR:\n{stderr_str}\n\nExit code: {returncode}"
+            elif stdout_str:
+                result = f"STDOUT:\n{stdout_str}\n\nExit code: {returncode}"
+            elif stderr_str:
+                result = f"STDERR:\n{stderr_str}\n\nExit code: {returncode}"
+            else:
+                result = f"\nExit code: {returncode}"
 
             # Truncate if too long
-            max_output = 50000
-            if len(result) > max_output:
-                result = result[:max_output] + f"\n\n... (output truncated at {max_output} characters)"
+            if len(result) > _MAX_OUTPUT:
+                result = result[:_MAX_OUTPUT] + f"\n\n... (output truncated at {_MAX_OUTPUT} characters)"
 
             return result
 
-        except asyncio.TimeoutError:
-            return f"Command timed out after {timeout} seconds: {command}"
-
         except Exception as e:
             logger.error(f"Command execution error: {e}")
             return f"Error executing command: {e}"
 
-    def _is_blocked(self, command: str) -> bool:
-        """Check if command is in the blocked list."""
-        command_lower = command.lower().strip()
+    @staticmethod
+    async def _spawn(command: str, working_dir: Optional[str]) -> asyncio.subprocess.Process:
+        """
+        Start a command, skipping /bin/sh when it uses no shell syntax.
 
-        for blocked in BLOCKED_COMMANDS:
-            if blocked in command_lower:
-                return True
+        Args:
+            command: Command to start
+            working_dir: Working directory
 
-        return False
+        Returns:
+            The started process
+        """
+        if _SHELL_META.isdisjoint(command):
+            argv = shlex.split(command)
+            if argv:
+                try:
+                    return await asyncio.create_subprocess_exec(
+                        *argv,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        cwd=working_dir,
+                    )
+                except (FileNotFoundError, PermissionError):
+                    # Shell builtins (cd, type, ...) and unrunnable files:
+                    # let the shell handle and report them as usual
+                    pass
+                except OSError as e:
+                    # Scripts without a shebang: the shell runs them itself
+                    if e.errno != errno.ENOEXEC:
+                        raise
+
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=working_dir,
+        )
+
+    def _is_blocked(self, command: str) -> bool:
+        """Check if command is in the blocked list."""
+        return _BLOCKED_RE.search(command) is not None
 
     def _is_dangerous(self, command: str) -> tuple[bool, str]:
         """
@@ -281,14 +428,26 @@ class ExecuteCommandTool(BaseTool):
         """
         # Check if it's a known safe command
         command_stripped = command.strip()
-        for safe in SAFE_PREFIXES:
-            if command_stripped.startswith(safe):
+        words = command_stripped.split(None, 1)
+        if words:
+            first = words[0]
+            if first in _SAFE_COMMANDS:
+                return False, ""
+            multiword = _SAFE_MULTIWORD.get(first)
+            if multiword and command_stripped.startswith(multiword):
                 return False, ""
 
-        # Check dangerous patterns
-        for pattern in self._dangerous_patterns:
-            if pattern.search(command):
-                return True, f"Matches dangerous pattern: {pattern.pattern}"
+        # Cheap substring prefilter before the regex
+        command_lower = command.lower()
+        if not any(trigger in command_lower for trigger in _DANGER_TRIGGERS):
+            return False, ""
+
+        # Check dangerous patterns; only dangerous commands pay for the
+        # in-order pass that picks the reason
+        if _DANGEROUS_RE.search(command):
+            for pattern in _DANGEROUS_EACH:
+                if pattern.search(command):
+                    return True, f"Matches dangerous pattern: {pattern.pattern}"
 
         return False, ""
 
@@ -345,8 +504,12 @@ class BackgroundCommandTool(BaseTool):
         ),
     ]
 
-    # Track background processes
+    # Running background processes, and recently exited ones until queried
     _processes: dict[int, asyncio.subprocess.Process] = {}
+    _finished: OrderedDict[int, asyncio.subprocess.Process] = OrderedDict()
+
+    # Strong references to the per-process reaper tasks
+    _reapers: set[asyncio.Task] = set()
 
     async def execute(
         self,
@@ -365,6 +528,12 @@ class BackgroundCommandTool(BaseTool):
         """
         logger.debug(f"Starting background command: {command}")
 
+        if len(self._processes) >= _MAX_BACKGROUND:
+            return (
+                f"Error starting background command: {_MAX_BACKGROUND} background "
+                f"processes already running; stop one first"
+            )
+
         try:
             process = await asyncio.create_subprocess_shell(
                 command,
@@ -373,9 +542,13 @@ class BackgroundCommandTool(BaseTool):
                 cwd=working_dir,
             )
 
-            # Track the process
+            # Track the process until it exits
             self._processes[process.pid] = process
 
+            reaper = asyncio.create_task(self._wait_and_remove(process))
+            self._reapers.add(reaper)
+            reaper.add_done_callback(self._reapers.discard)
+
             return (
                 f"Background process started\n"
                 f"PID: {process.pid}\n"
@@ -387,20 +560,39 @@ class BackgroundCommandTool(BaseTool):
             logger.error(f"Failed to start background command: {e}")
             return f"Error starting background command: {e}"
 
+    @classmethod
+    async def _wait_and_remove(cls, process: asyncio.subprocess.Process) -> None:
+        """Wait for a background process to exit, then move it to the finished LRU."""
+        await process.wait()
+        if cls._processes.get(process.pid) is process:
+            del cls._processes[process.pid]
+            cls._finished[process.pid] = process
+            cls._finished.move_to_end(process.pid)
+            while len(cls._finished) > _MAX_FINISHED:
+                cls._finished.popitem(last=False)
+        logger.debug(f"Background process {process.pid} exited with code {process.returncode}")
+
     @classmethod
     def get_process(cls, pid: int) -> Optional[asyncio.subprocess.Process]:
-        """Get a tracked background process by PID."""
-        return cls._processes.get(pid)
+        """
+        Get a tracked background process by PID.
+
+        A process that has exited is returned once (with its returncode
+        set) and then forgotten.
+        """
+        process = cls._processes.get(pid)
+        if process is None:
+            process = cls._finished.pop(pid, None)
+        return process
 
     @classmethod
     def stop_process(cls, pid: int) -> bool:
-        """Stop a background process."""
-        process = cls._processes.get(pid)
+        """Stop a background process (True if it was tracked, running or exited)."""
+        process = cls._processes.pop(pid, None)
         if process:
             process.terminate()
-            del cls._processes[pid]
             return True
-        return False
+        return cls._finished.pop(pid, None) is not None
 
 
 # Tool instances for easy access
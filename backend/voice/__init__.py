@@ -7,7 +7,16 @@ Components:
 """
 
 from .stt import WhisperSTT, get_stt
-from .tts import KokoroTTS, get_tts, get_available_voices, KOKORO_VOICES, DEFAULT_VOICE
+from .tts import (
+    KokoroTTS,
+    get_tts,
+    get_available_voices,
+    find_voices,
+    is_valid_voice,
+    KOKORO_VOICES,
+    VOICE_IDS,
+    DEFAULT_VOICE,
+)
 from .handler import VoiceHandler, get_voice_handler
 
 __all__ = [
@@ -18,7 +27,10 @@ __all__ = [
     "KokoroTTS",
     "get_tts",
     "get_available_voices",
+    "find_voices",
+    "is_valid_voice",
     "KOKORO_VOICES",
+    "VOICE_IDS",
     "DEFAULT_VOICE",
     # Handler
     "VoiceHandler",
@@ -2,14 +2,23 @@
 
 import asyncio
 import base64
-from typing import Optional, AsyncGenerator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Mapping, Optional, AsyncGenerator
 
 from config import get_logger
 from .stt import get_stt, ModelSize
-from .tts import get_tts, DEFAULT_VOICE, KOKORO_VOICES, get_available_voices
+from .tts import get_tts, DEFAULT_VOICE, get_available_voices, is_valid_voice
 
 logger = get_logger(__name__)
 
+# Dedicated pool for transcription so STT work neither competes with the
+# default executor nor runs unbounded model calls in parallel
+_STT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 2) // 2),
+    thread_name_prefix="whisper",
+)
+
 
 class VoiceHandler:
     """
@@ -48,6 +57,32 @@ class VoiceHandler:
             self._stt = get_stt(self.whisper_model)
         return self._stt
 
+    def preload_stt(self) -> Optional[asyncio.Future]:
+        """
+        Start loading the Whisper model in the background.
+
+        Returns:
+            Future for the load, or None if no event loop is running
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        future = loop.run_in_executor(_STT_EXECUTOR, lambda: self.stt)
+
+        def log_result(done: asyncio.Future) -> None:
+            if done.cancelled():
+                return
+            if done.exception() is not None:
+                logger.warning(f"Failed to preload Whisper model: {done.exception()}")
+                logger.warning("Model will load on first voice request")
+            else:
+                logger.info("Whisper model preloaded successfully")
+
+        future.add_done_callback(log_result)
+        return future
+
     @property
     def tts(self):
         """Lazy-load TTS (downloads Kokoro model on first use)."""
@@ -66,7 +101,7 @@ class VoiceHandler:
         Returns:
             True if voice was changed successfully
         """
-        if voice not in KOKORO_VOICES:
+        if not is_valid_voice(voice):
             logger.warning(f"Unknown voice '{voice}'")
             return False
 
@@ -80,7 +115,7 @@ class VoiceHandler:
         """
         Transcribe audio to text using local Whisper.
 
-        Runs in thread pool since Whisper is CPU-bound.
+        Runs in the dedicated STT thread pool since Whisper is CPU-bound.
 
         Args:
             audio_data: Raw audio bytes
@@ -90,9 +125,9 @@ class VoiceHandler:
             Transcribed text
         """
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             text = await loop.run_in_executor(
-                None,
+                _STT_EXECUTOR,
                 lambda: self.stt.transcribe(audio_data, input_format=input_format),
             )
             logger.info(f"Transcribed: {text[:100]}...")
@@ -129,7 +164,7 @@ class VoiceHandler:
             text: Text to synthesize
 
         Yields:
-            WAV audio chunks
+            16-bit PCM audio chunks (24kHz, mono)
         """
         try:
             async for chunk in self.tts.synthesize_stream(text):
@@ -150,7 +185,7 @@ class VoiceHandler:
         return base64.b64decode(audio_b64)
 
     @staticmethod
-    def get_available_voices() -> dict:
+    def get_available_voices() -> Mapping[str, dict]:
         """Get all available Kokoro TTS voices."""
         return get_available_voices()
 
@@ -166,6 +201,10 @@ def get_voice_handler(
     """
     Get singleton voice handler.
 
+    Creating the handler inside a running event loop starts loading the
+    Whisper model in the background, so the first transcription finds
+    it warm.
+
     Args:
         whisper_model: Whisper model size
         tts_voice: Kokoro voice ID
@@ -179,6 +218,7 @@ def get_voice_handler(
             whisper_model=whisper_model,
             tts_voice=tts_voice,
         )
+        _handler.preload_stt()
     return _handler
 
 
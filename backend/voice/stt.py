@@ -4,10 +4,32 @@ FREE - runs entirely on your machine.
 No API calls, no costs, works offline.
 """
 
-import tempfile
-from typing import Optional, Literal
-
+import functools
+import io
+import math
+import os
+import threading
+from typing import Optional, Literal, Union
+
+import numpy as np
+import soundfile as sf
 from faster_whisper import WhisperModel
+from faster_whisper.audio import decode_audio
+
+try:
+    from faster_whisper.vad import get_vad_model
+except ImportError:
+    get_vad_model = None
+
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # faster-whisper < 1.1
+    BatchedInferencePipeline = None
+
+try:
+    from scipy.signal import firwin, resample_poly
+except ImportError:
+    firwin = resample_poly = None
 
 from config import get_logger
 
@@ -15,6 +37,27 @@ logger = get_logger(__name__)
 
 ModelSize = Literal["tiny", "base", "small", "medium", "large-v3"]
 
+# Whisper expects 16kHz mono audio
+SAMPLE_RATE = 16000
+
+# Containers libsndfile decodes natively; everything else (webm, opus,
+# mp3, ...) goes through PyAV, which faster-whisper already depends on
+_SOUNDFILE_FORMATS = frozenset({"wav", "flac", "aiff"})
+
+# Clips shorter than this decode greedily; beam search costs several
+# times more and gains little on short voice utterances
+SHORT_CLIP_SECONDS = 15.0
+LONG_CLIP_BEAM_SIZE = 5
+
+# Clips longer than this are split into chunks and decoded in batches
+BATCHED_CLIP_SECONDS = 30.0
+BATCH_SIZE = 8
+
+# Concurrent transcriptions inside CTranslate2. Each worker keeps its own
+# decoding state and buffers, so memory grows with this; the CPU cores
+# are split between workers rather than oversubscribed.
+NUM_WORKERS = 2
+
 # Model specs:
 # tiny   - 75MB,  fastest, good for simple speech
 # base   - 142MB, very fast, good accuracy
@@ -42,7 +85,7 @@ class WhisperSTT:
         Args:
             model_size: Model to use (tiny, base, small, medium, large-v3)
             device: "cuda", "cpu", or "auto"
-            compute_type: "float16", "int8", or "auto"
+            compute_type: "int8_float16", "float16", "int8", or "auto"
         """
         self.model_size = model_size
 
@@ -54,16 +97,35 @@ class WhisperSTT:
             except ImportError:
                 device = "cpu"
 
-        # Auto-select compute type for performance
+        # Auto-select compute type for performance: int8 weights with
+        # fp16 activations on GPU halves weight bandwidth
         if compute_type == "auto":
-            compute_type = "float16" if device == "cuda" else "int8"
+            compute_type = "int8_float16" if device == "cuda" else "int8"
 
         logger.info(f"Loading Whisper '{model_size}' on {device}...")
 
-        self.model = WhisperModel(
-            model_size,
+        # Workers let concurrent transcriptions overlap inside CTranslate2;
+        # each gets an equal share of the cores
+        model_kwargs = dict(
             device=device,
-            compute_type=compute_type,
+            cpu_threads=max(1, (os.cpu_count() or 1) // NUM_WORKERS),
+            num_workers=NUM_WORKERS,
+        )
+
+        try:
+            self.model = WhisperModel(model_size, compute_type=compute_type, **model_kwargs)
+        except ValueError as e:
+            # GPUs without int8 support (pre-Turing) reject int8_float16
+            if compute_type != "int8_float16":
+                raise
+            logger.warning(f"int8_float16 unsupported ({e}), falling back to float16")
+            compute_type = "float16"
+            self.model = WhisperModel(model_size, compute_type=compute_type, **model_kwargs)
+
+        self.batched = (
+            BatchedInferencePipeline(model=self.model)
+            if BatchedInferencePipeline is not None
+            else None
         )
 
         self.device = device
@@ -71,11 +133,34 @@ class WhisperSTT:
 
         logger.info("Whisper model loaded successfully")
 
+    def warmup(self) -> None:
+        """
+        Run one tiny transcription so kernel selection and allocator
+        setup happen now rather than on the first real request.
+
+        Also loads the Silero VAD model, which faster-whisper otherwise
+        loads lazily on the first vad_filter call.
+        """
+        if get_vad_model is not None:
+            get_vad_model()
+
+        silence = np.zeros(SAMPLE_RATE // 10, dtype=np.float32)
+        segments, _ = self.model.transcribe(
+            silence,
+            language="en",
+            beam_size=1,
+            vad_filter=False,  # VAD would drop the silence and skip the model
+        )
+        # Segments are generated lazily; consume them to run the model
+        for _ in segments:
+            pass
+
     def transcribe(
         self,
         audio_data: bytes,
         language: Optional[str] = None,
         input_format: str = "webm",
+        beam_size: Optional[int] = None,
     ) -> str:
         """
         Transcribe audio bytes to text.
@@ -84,58 +169,69 @@ class WhisperSTT:
             audio_data: Audio bytes (WAV, WebM, MP3, etc.)
             language: Optional language code (auto-detects if None)
             input_format: Format of the input audio (webm, wav, mp3)
+            beam_size: Beam width (picked from clip length if None)
 
         Returns:
             Transcribed text
         """
-        from pydub import AudioSegment
-        import io
-
-        # Convert audio to WAV format for Whisper
+        # Decode in-process straight to a float32 array; faster-whisper
+        # accepts samples directly, so no ffmpeg subprocess or WAV file
         try:
-            # Load audio from bytes
-            audio = AudioSegment.from_file(
-                io.BytesIO(audio_data),
-                format=input_format if input_format != "webm" else "webm",
-            )
-
-            # Convert to mono 16kHz WAV (optimal for Whisper)
-            audio = audio.set_channels(1).set_frame_rate(16000)
-
-            # Export to temp WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                audio.export(f.name, format="wav")
-                wav_path = f.name
-
-            try:
-                return self.transcribe_file(wav_path, language)
-            finally:
-                # Clean up temp file
-                import os
-                os.unlink(wav_path)
-
+            samples = decode_samples(audio_data, input_format)
         except Exception as e:
             logger.error(f"Failed to convert audio: {e}")
             raise
 
-    def transcribe_file(self, file_path: str, language: Optional[str] = None) -> str:
+        return self._transcribe(samples, language, beam_size)
+
+    def transcribe_file(
+        self,
+        file_path: str,
+        language: Optional[str] = None,
+        beam_size: Optional[int] = None,
+    ) -> str:
         """
         Transcribe an audio file.
 
         Args:
             file_path: Path to audio file
             language: Optional language code
+            beam_size: Beam width (defaults to the long-clip setting)
 
         Returns:
             Transcribed text
         """
-        segments, info = self.model.transcribe(
-            file_path,
+        return self._transcribe(file_path, language, beam_size)
+
+    def _transcribe(
+        self,
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = None,
+        beam_size: Optional[int] = None,
+    ) -> str:
+        """Run Whisper on a file path or 16kHz mono float32 samples."""
+        # Duration is only known up front for decoded samples
+        duration = len(audio) / SAMPLE_RATE if isinstance(audio, np.ndarray) else None
+
+        if beam_size is None:
+            short = duration is not None and duration < SHORT_CLIP_SECONDS
+            beam_size = 1 if short else LONG_CLIP_BEAM_SIZE
+
+        options = dict(
             language=language,
-            beam_size=5,
+            beam_size=beam_size,
             vad_filter=True,  # Filter silence
             vad_parameters={"min_silence_duration_ms": 500},
         )
+        if beam_size == 1:
+            # Greedy decoding: also sample one candidate (not five) in the
+            # temperature fallback; beam search keeps the library default
+            options["best_of"] = 1
+
+        if self.batched is not None and duration is not None and duration > BATCHED_CLIP_SECONDS:
+            segments, info = self.batched.transcribe(audio, batch_size=BATCH_SIZE, **options)
+        else:
+            segments, info = self.model.transcribe(audio, **options)
 
         text = " ".join(seg.text.strip() for seg in segments)
 
@@ -146,19 +242,85 @@ class WhisperSTT:
         return text.strip()
 
 
+def decode_samples(audio_data: bytes, input_format: str = "webm") -> np.ndarray:
+    """
+    Decode audio bytes to 16kHz mono float32 samples.
+
+    Args:
+        audio_data: Encoded audio bytes
+        input_format: Format of the input audio (webm, wav, mp3)
+
+    Returns:
+        Samples in [-1, 1] at SAMPLE_RATE
+    """
+    if input_format not in _SOUNDFILE_FORMATS:
+        # PyAV decodes and resamples in one pass
+        return decode_audio(io.BytesIO(audio_data), sampling_rate=SAMPLE_RATE)
+
+    data, src_rate = sf.read(io.BytesIO(audio_data), dtype="float32", always_2d=True)
+
+    # Mix down to mono
+    mono = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+
+    return _resample(mono, src_rate)
+
+
+@functools.lru_cache(maxsize=8)
+def _resample_filter(src_rate: int) -> tuple[int, int, np.ndarray]:
+    """
+    Design the polyphase resampling filter for a source rate.
+
+    Matches resample_poly's default (Kaiser, beta 5.0) design, computed
+    once per rate instead of on every call.
+
+    Returns:
+        (up, down, filter taps)
+    """
+    g = math.gcd(SAMPLE_RATE, src_rate)
+    up, down = SAMPLE_RATE // g, src_rate // g
+    max_rate = max(up, down)
+    taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    return up, down, taps
+
+
+def _resample(samples: np.ndarray, src_rate: int) -> np.ndarray:
+    """Resample mono float32 samples to SAMPLE_RATE."""
+    if src_rate == SAMPLE_RATE:
+        return np.ascontiguousarray(samples, dtype=np.float32)
+
+    if resample_poly is not None:
+        # Polyphase filter with the rate ratio reduced to lowest terms
+        up, down, taps = _resample_filter(src_rate)
+        return resample_poly(samples, up, down, window=taps).astype(np.float32)
+
+    # Linear interpolation fallback without SciPy
+    n_out = int(round(len(samples) * SAMPLE_RATE / src_rate))
+    positions = np.arange(n_out, dtype=np.float64) * (src_rate / SAMPLE_RATE)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
 # Singleton
 _stt: Optional[WhisperSTT] = None
+_stt_lock = threading.Lock()
 
 
 def get_stt(model_size: ModelSize = "base") -> WhisperSTT:
     """
     Get singleton STT instance.
 
-    First call downloads model (~466MB for 'small').
+    First call downloads model (~466MB for 'small') and warms it up.
+    Safe to call from several threads; the model is loaded once.
     """
     global _stt
     if _stt is None:
-        _stt = WhisperSTT(model_size=model_size)
+        with _stt_lock:
+            if _stt is None:
+                stt = WhisperSTT(model_size=model_size)
+                try:
+                    stt.warmup()
+                except Exception as e:
+                    logger.warning(f"Whisper warmup failed: {e}")
+                _stt = stt
     return _stt
 
 
@@ -4,15 +4,26 @@ FREE - runs entirely on your machine.
 No API calls, no costs, works offline.
 """
 
-import io
+import os
+import re
+import struct
+import sys
+import time
 import asyncio
-from typing import Optional, Literal, AsyncGenerator
+import contextlib
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator, Mapping, Optional, Literal, AsyncGenerator
 
-import numpy as np
-import soundfile as sf
-from kokoro import KPipeline
+from config import get_logger, settings
 
-from config import get_logger
+# kokoro pulls in torch; it and numpy are imported on first
+# synthesis so importing this module stays cheap
+if TYPE_CHECKING:
+    from kokoro import KPipeline
+    from kokoro_onnx import Kokoro
 
 logger = get_logger(__name__)
 
@@ -23,7 +34,7 @@ LanguageCode = Literal["a", "b", "e", "f", "h", "i", "j", "p", "z"]
 # First char: language (a=American, b=British, j=Japanese, etc.)
 # Second char: gender (f=female, m=male)
 
-KOKORO_VOICES = {
+KOKORO_VOICES = MappingProxyType({
     # American English - Female
     "af_heart": {"name": "Heart", "gender": "female", "lang": "American English"},
     "af_alloy": {"name": "Alloy", "gender": "female", "lang": "American English"},
@@ -89,11 +100,176 @@ KOKORO_VOICES = {
     "pf_dora": {"name": "Dora", "gender": "female", "lang": "Brazilian Portuguese"},
     "pm_alex": {"name": "Alex", "gender": "male", "lang": "Brazilian Portuguese"},
     "pm_santa": {"name": "Santa", "gender": "male", "lang": "Brazilian Portuguese"},
-}
+})
+
+# Column views of the table above, built once at import
+VOICE_IDS: tuple[str, ...] = tuple(KOKORO_VOICES)
+VOICE_NAMES: tuple[str, ...] = tuple(v["name"] for v in KOKORO_VOICES.values())
+VOICE_GENDERS: tuple[str, ...] = tuple(v["gender"] for v in KOKORO_VOICES.values())
+VOICE_LANGS: tuple[str, ...] = tuple(v["lang"] for v in KOKORO_VOICES.values())
+
+_VOICE_ID_SET = frozenset(VOICE_IDS)
+
+
+def _index_by(column: tuple[str, ...]) -> MappingProxyType:
+    """Map each distinct value in a voice column to its voice IDs."""
+    index: dict[str, list[str]] = {}
+    for voice_id, value in zip(VOICE_IDS, column):
+        index.setdefault(value, []).append(voice_id)
+    return MappingProxyType({value: tuple(ids) for value, ids in index.items()})
+
+
+_BY_LANG = _index_by(VOICE_LANGS)
+_BY_GENDER = _index_by(VOICE_GENDERS)
 
 DEFAULT_VOICE = "af_heart"
 DEFAULT_LANG = "a"
 
+# Kokoro output sample rate
+SAMPLE_RATE = 24000
+
+# Format of synthesize_stream chunks: headerless 16-bit little-endian mono PCM
+STREAM_FORMAT = "pcm_s16le"
+
+# Per-language pipelines kept loaded (they share one model; each adds
+# its own G2P front end and voice packs)
+MAX_PIPELINES = 3
+
+# Audio chunks buffered ahead of a slow stream consumer
+STREAM_QUEUE_SIZE = 8
+
+# Caps synthesis requests in flight across all TTS instances, so bursts
+# queue here instead of piling onto the model
+_tts_sem = asyncio.Semaphore(settings.tts_concurrent_requests)
+
+# Voice packs kept loaded across pipelines (each is ~0.5 MB)
+VOICE_PACK_CACHE_SIZE = 16
+
+# kokoro-onnx release files, expected under settings.data_dir / "kokoro"
+ONNX_MODEL_FILE = "kokoro-v1.0.onnx"
+ONNX_VOICES_FILE = "voices-v1.0.bin"
+
+# kokoro-onnx phonemizes with espeak, which names languages differently
+_ONNX_LANGS = {
+    "a": "en-us",
+    "b": "en-gb",
+    "e": "es",
+    "f": "fr-fr",
+    "h": "hi",
+    "i": "it",
+    "j": "ja",
+    "p": "pt-br",
+    "z": "cmn",
+}
+
+# Candidate sentence boundaries: whitespace after Latin terminators, or
+# directly after CJK ones (which aren't followed by a space)
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])")
+
+# Opening punctuation allowed before the capital that starts a sentence
+_SENTENCE_OPENERS = "\"'“‘(¿¡"
+
+# Words whose trailing period doesn't end a sentence
+_ABBREVIATIONS = frozenset({
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "sra.", "jr.", "st.", "mt.",
+    "mme.", "mlle.", "vs.", "e.g.", "i.e.", "no.", "fig.", "inc.", "ltd.", "co.",
+})
+
+
+def _split_sentences(text: str) -> list[str]:
+    """
+    Split text into sentences for the pipeline.
+
+    Kokoro splits its input on newlines and, for English, again once a
+    chunk nears its ~510 phoneme limit, so a paragraph still comes out
+    as a few long segments; feeding it sentence by sentence lets the
+    first chunk stream out after the first sentence instead.
+
+    After a Latin terminator, a break needs the next sentence to start
+    with a capital (optionally after a quote or bracket), and the word
+    before it must not be a known abbreviation or an initial, so
+    "Mr. Smith" or "e.g. this" stay in one piece.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty sentences, in order
+    """
+    sentences = []
+    start = 0
+    for boundary in _SENTENCE_END_RE.finditer(text):
+        if boundary.group():
+            first = text[boundary.end():boundary.end() + 2].lstrip(_SENTENCE_OPENERS)[:1]
+            if not first.isupper():
+                continue
+            word = text[start:boundary.start()].rsplit(None, 1)[-1].lower()
+            if word in _ABBREVIATIONS or (len(word) == 2 and word[0].isalpha()):
+                continue
+        sentences.append(text[start:boundary.start()])
+        start = boundary.end()
+    sentences.append(text[start:])
+    return [s for s in (part.strip() for part in sentences) if s]
+
+
+@functools.lru_cache(maxsize=VOICE_PACK_CACHE_SIZE)
+def _load_voice_pack(repo_id: str, voice: str, device: str):
+    """
+    Load a voice pack onto a device, once per process.
+
+    Kokoro caches packs per pipeline, so each language pipeline (and each
+    one rebuilt after eviction) would read the file again. Loading with
+    mmap leaves the CPU copy backed by the page cache.
+
+    Args:
+        repo_id: Hugging Face repo holding the voices
+        voice: Voice ID
+        device: Device to place the pack on
+
+    Returns:
+        Voice pack tensor on the device
+    """
+    import torch
+    from huggingface_hub import hf_hub_download
+
+    path = hf_hub_download(repo_id=repo_id, filename=f"voices/{voice}.pt")
+    return torch.load(path, map_location=device, mmap=True, weights_only=True)
+
+
+def _keep_fp32(module) -> None:
+    """
+    Make a module run in fp32 even inside an autocast region.
+
+    Kokoro's iSTFTNet decoder builds complex spectra from its conv output
+    (magnitude * exp(phase * 1j)), and torch has no bf16/fp16 complex
+    kernels for that; its inputs are cast back to float32 and autocast is
+    disabled for its forward.
+
+    Args:
+        module: Module to patch in place (e.g. KModel.decoder)
+    """
+    import torch
+
+    forward = module.forward
+
+    @functools.wraps(forward)
+    def fp32_forward(*args, **kwargs):
+        args = [a.float() if torch.is_tensor(a) and a.is_floating_point() else a for a in args]
+        with torch.autocast(device_type="cuda", enabled=False):
+            return forward(*args, **kwargs)
+
+    module.forward = fp32_forward
+
+
+def _onnx_providers() -> list[str]:
+    """Pick ONNX Runtime providers: the platform's accelerator if available, then CPU."""
+    import onnxruntime as ort
+
+    preferred = "CoreMLExecutionProvider" if sys.platform == "darwin" else "CUDAExecutionProvider"
+    if preferred in ort.get_available_providers():
+        return [preferred, "CPUExecutionProvider"]
+    return ["CPUExecutionProvider"]
+
 
 class KokoroTTS:
     """
@@ -106,6 +282,8 @@ class KokoroTTS:
         self,
         voice: str = DEFAULT_VOICE,
         lang_code: LanguageCode = DEFAULT_LANG,
+        device: str = "auto",
+        backend: Optional[str] = None,
     ):
         """
         Initialize Kokoro TTS.
@@ -113,21 +291,241 @@ class KokoroTTS:
         Args:
             voice: Voice ID (e.g., af_heart, am_adam)
             lang_code: Language code ('a' for American, 'b' for British, etc.)
+            device: "cuda", "mps", "cpu", or "auto"
+            backend: "torch" (kokoro) or "onnx" (kokoro-onnx on ONNX
+                Runtime); defaults to settings.tts_backend
         """
         self.voice = voice
         self.lang_code = lang_code
-        self._pipeline: Optional[KPipeline] = None
+        self.backend = backend or settings.tts_backend
+        self._pipelines: OrderedDict[str, "KPipeline"] = OrderedDict()
+        self._onnx: Optional["Kokoro"] = None
+
+        # Idle offload state; only touched on the synthesis thread except
+        # the timer handle, which lives on the event loop
+        self._last_used = time.monotonic()
+        self._offloaded = False
+        self._offload_timer: Optional[asyncio.TimerHandle] = None
+
+        # Forward passes run one at a time on this instance's own thread,
+        # so the device sees serialized calls and the default pool stays free
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro")
+
+        # Auto-detect device
+        if device == "auto":
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    device = "cuda"
+                # Kokoro needs PyTorch's CPU fallback for a few MPS ops
+                elif (
+                    os.environ.get("PYTORCH_ENABLE_MPS_FALLBACK") == "1"
+                    and torch.backends.mps.is_available()
+                ):
+                    device = "mps"
+                else:
+                    device = "cpu"
+            except ImportError:
+                device = "cpu"
+
+        self.device = device
+
+        logger.info(f"Kokoro TTS initialized with voice '{voice}' on {device} ({self.backend})")
+
+    @property
+    def pipeline(self) -> "KPipeline":
+        """Lazy-load the pipeline for the current language (downloads model on first use)."""
+        pipeline = self._pipelines.get(self.lang_code)
+        if pipeline is not None:
+            self._pipelines.move_to_end(self.lang_code)
+            return pipeline
+
+        from kokoro import KPipeline
+
+        logger.info(f"Loading Kokoro pipeline (lang={self.lang_code}) on {self.device}...")
+
+        if self.device == "cuda":
+            import torch
+            # Allow TF32 tensor cores for the remaining fp32 matmuls
+            torch.set_float32_matmul_precision("high")
+
+        # Reuse the already-loaded model; only the language front end is new
+        model = next(iter(self._pipelines.values())).model if self._pipelines else True
+        pipeline = KPipeline(lang_code=self.lang_code, model=model, device=self.device)
+        if model is True and self.device == "cpu":
+            self._tune_cpu_model(pipeline.model)
+        if model is True and self.device == "cuda" and settings.tts_mixed_precision:
+            _keep_fp32(pipeline.model.decoder)
+        self._pipelines[self.lang_code] = pipeline
+
+        # Bound memory by dropping the least recently used language
+        while len(self._pipelines) > MAX_PIPELINES:
+            evicted, _ = self._pipelines.popitem(last=False)
+            logger.info(f"Evicted Kokoro pipeline (lang={evicted})")
+
+        logger.info("Kokoro pipeline loaded successfully")
+        return pipeline
+
+    @staticmethod
+    def _tune_cpu_model(model) -> None:
+        """
+        Set up a freshly loaded model for CPU inference.
 
-        logger.info(f"Kokoro TTS initialized with voice '{voice}'")
+        Uses every core for intra-op work and, when settings.tts_int8 is
+        on, swaps the Linear and LSTM layers for int8 dynamically
+        quantized ones (fbgemm kernels; roughly half the weight traffic).
+        Off by default since quantized output can differ audibly.
+
+        Args:
+            model: Kokoro KModel, quantized in place
+        """
+        import torch
+
+        torch.set_num_threads(os.cpu_count() or 1)
+        try:
+            torch.set_num_interop_threads(2)
+        except RuntimeError:
+            # Only settable before any inter-op work has run
+            pass
+
+        if not settings.tts_int8:
+            return
+
+        try:
+            torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8, inplace=True
+            )
+            logger.info("Kokoro model quantized to int8")
+        except Exception as e:
+            logger.warning(f"int8 quantization failed, using fp32: {e}")
+
+    def evict_pipeline(self, lang_code: str) -> bool:
+        """
+        Drop the cached pipeline for a language.
+
+        Args:
+            lang_code: Language code of the pipeline to drop
+
+        Returns:
+            True if a pipeline was cached for that language
+        """
+        return self._pipelines.pop(lang_code, None) is not None
 
     @property
-    def pipeline(self) -> KPipeline:
-        """Lazy-load the pipeline (downloads model on first use)."""
-        if self._pipeline is None:
-            logger.info(f"Loading Kokoro pipeline (lang={self.lang_code})...")
-            self._pipeline = KPipeline(lang_code=self.lang_code)
-            logger.info("Kokoro pipeline loaded successfully")
-        return self._pipeline
+    def onnx_model(self) -> "Kokoro":
+        """Lazy-load the kokoro-onnx model (all languages share one session)."""
+        if self._onnx is None:
+            import onnxruntime as ort
+            from kokoro_onnx import Kokoro
+
+            model_dir = settings.data_dir / "kokoro"
+            providers = _onnx_providers()
+            logger.info(f"Loading Kokoro ONNX model with {providers}...")
+            session = ort.InferenceSession(str(model_dir / ONNX_MODEL_FILE), providers=providers)
+            self._onnx = Kokoro.from_session(session, str(model_dir / ONNX_VOICES_FILE))
+            logger.info("Kokoro ONNX model loaded successfully")
+        return self._onnx
+
+    def _segments(self, text: str) -> Iterator:
+        """
+        Synthesize text sentence by sentence on the configured backend.
+
+        Args:
+            text: Text to synthesize
+
+        Yields:
+            Float audio arrays at SAMPLE_RATE, one per pipeline segment
+        """
+        sentences = _split_sentences(text)
+        try:
+            yield from self._backend_segments(sentences)
+        finally:
+            self._last_used = time.monotonic()
+
+    def _backend_segments(self, sentences: list[str]) -> Iterator:
+        """Run sentences through the ONNX model or the torch pipeline."""
+        if self.backend == "onnx":
+            kokoro = self.onnx_model
+            lang = _ONNX_LANGS[self.lang_code]
+            for sentence in sentences:
+                samples, _ = kokoro.create(sentence, voice=self.voice, lang=lang)
+                yield samples
+            return
+
+        pipeline = self._voice_pipeline()
+        if self._offloaded:
+            pipeline.model.to(self.device)
+            self._offloaded = False
+            logger.info(f"Kokoro model moved back to {self.device}")
+
+        with self._inference_context():
+            for _, _, audio in pipeline(sentences, voice=self.voice):
+                if audio is not None:
+                    yield audio.float()
+
+    def _schedule_offload(self) -> None:
+        """
+        Re-arm the idle timer that moves the model off the accelerator.
+
+        Called on the event loop after each request. When it fires the
+        offload is queued on the synthesis thread, so it can never run
+        in the middle of a forward pass.
+        """
+        idle = settings.tts_idle_offload_seconds
+        if self.backend != "torch" or self.device == "cpu" or idle <= 0:
+            return
+        if self._offload_timer is not None:
+            self._offload_timer.cancel()
+        self._offload_timer = asyncio.get_running_loop().call_later(
+            idle, self._executor.submit, self._offload_if_idle
+        )
+
+    def _offload_if_idle(self) -> None:
+        """Move the model to CPU if no synthesis ran for the idle period."""
+        if self._offloaded or not self._pipelines:
+            return
+        if time.monotonic() - self._last_used < settings.tts_idle_offload_seconds:
+            return
+
+        # All language pipelines share this one model
+        next(iter(self._pipelines.values())).model.to("cpu")
+        self._offloaded = True
+        if self.device == "cuda":
+            import torch
+            torch.cuda.empty_cache()
+        logger.info("Kokoro model offloaded to CPU while idle")
+
+    def _voice_pipeline(self) -> "KPipeline":
+        """
+        Get the pipeline with the current voice pack resident on the device.
+
+        Kokoro caches voice packs on the CPU and copies the whole pack to
+        the model's device for every segment; storing the device copy in
+        its cache (keyed by voice name) makes that copy a no-op.
+        """
+        pipeline = self.pipeline
+        if self.voice not in pipeline.voices:
+            pack = _load_voice_pack(pipeline.repo_id, self.voice, self.device)
+            pipeline.voices[self.voice] = pack
+        return pipeline
+
+    def _inference_context(self) -> contextlib.ExitStack:
+        """
+        Context for Kokoro forward passes.
+
+        Disables autograd tracking and, on CUDA with
+        settings.tts_mixed_precision, runs under autocast (bf16 where
+        supported, else fp16) so the text encoder and predictor matmuls use
+        tensor cores. The decoder is kept in fp32 (see _keep_fp32).
+        """
+        import torch
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self.device == "cuda" and settings.tts_mixed_precision:
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            stack.enter_context(torch.autocast(device_type="cuda", dtype=dtype))
+        return stack
 
     def set_voice(self, voice: str) -> bool:
         """
@@ -139,7 +537,7 @@ class KokoroTTS:
         Returns:
             True if voice was changed successfully
         """
-        if voice not in KOKORO_VOICES:
+        if not is_valid_voice(voice):
             logger.warning(f"Unknown voice '{voice}', keeping current")
             return False
 
@@ -148,10 +546,9 @@ class KokoroTTS:
         # Update language code based on voice prefix (first char)
         self.lang_code = voice[0]
 
-        # Reset pipeline if language changed
+        # Pipelines are cached per language, so switching back is free
         if self.lang_code != old_lang:
-            self._pipeline = None
-            logger.info(f"Language changed to '{self.lang_code}', pipeline will reload")
+            logger.info(f"Language changed to '{self.lang_code}'")
 
         logger.info(f"Voice changed to '{voice}'")
         return True
@@ -169,27 +566,26 @@ class KokoroTTS:
         if not text.strip():
             return b""
 
-        try:
-            # Generate audio segments
-            generator = self.pipeline(text, voice=self.voice)
+        import numpy as np
 
+        try:
             # Collect all audio segments
-            audio_segments = []
-            for gs, ps, audio in generator:
-                audio_segments.append(audio)
+            audio_segments = list(self._segments(text))
 
             if not audio_segments:
                 return b""
 
-            # Concatenate segments
-            full_audio = np.concatenate(audio_segments)
-
-            # Convert to WAV bytes
-            buffer = io.BytesIO()
-            sf.write(buffer, full_audio, 24000, format="WAV")
-            buffer.seek(0)
-
-            wav_bytes = buffer.getvalue()
+            # Convert each segment straight into its slot after the header
+            num_samples = sum(len(audio) for audio in audio_segments)
+            wav = _wav_header(num_samples)
+            pcm = np.frombuffer(wav, dtype="<i2", offset=44)
+            pos = 0
+            for audio in audio_segments:
+                samples = np.clip(np.asarray(audio, dtype=np.float32), -1.0, 1.0)
+                pcm[pos:pos + len(samples)] = np.rint(samples * 32767)
+                pos += len(samples)
+
+            wav_bytes = bytes(wav)
             logger.debug(f"Synthesized {len(text)} chars -> {len(wav_bytes)} bytes")
             return wav_bytes
 
@@ -201,7 +597,8 @@ class KokoroTTS:
         """
         Asynchronously synthesize text to audio.
 
-        Runs synthesis in thread pool since Kokoro is CPU-bound.
+        Runs synthesis on the instance's synthesis thread since Kokoro
+        is compute-bound.
 
         Args:
             text: Text to synthesize
@@ -209,67 +606,78 @@ class KokoroTTS:
         Returns:
             WAV audio bytes (24kHz, mono)
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.synthesize_sync, text)
+        async with _tts_sem:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self._executor, self.synthesize_sync, text)
+            finally:
+                self._schedule_offload()
 
     async def synthesize_stream(self, text: str) -> AsyncGenerator[bytes, None]:
         """
         Stream synthesized audio chunks as they're generated.
 
-        Uses a queue to yield audio chunks as soon as they're ready,
-        reducing latency for the first audio chunk.
+        The synthesis thread runs the pipeline and hands each chunk to the
+        event loop through a bounded asyncio queue, so chunks are yielded
+        as soon as they're ready without polling.
+
+        Chunks are raw PCM (see STREAM_FORMAT) at SAMPLE_RATE rather than
+        self-contained WAV files, so no per-chunk header or encoder pass.
 
         Args:
             text: Text to synthesize
 
         Yields:
-            WAV audio chunks
+            16-bit PCM audio chunks (24kHz, mono)
         """
         if not text.strip():
             return
 
-        import queue
         import threading
 
-        audio_queue: queue.Queue = queue.Queue()
+        await _tts_sem.acquire()
+
+        loop = asyncio.get_running_loop()
+        audio_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        stop = threading.Event()
         error_holder: list = []
 
+        def put(item: Optional[bytes]) -> None:
+            # Blocks the worker while the queue is full (back-pressure)
+            asyncio.run_coroutine_threadsafe(audio_queue.put(item), loop).result()
+
         def generate_in_thread():
             """Generate audio segments and put them in queue."""
             try:
-                for gs, ps, audio in self.pipeline(text, voice=self.voice):
-                    # Convert to WAV bytes immediately
-                    buffer = io.BytesIO()
-                    sf.write(buffer, audio, 24000, format="WAV")
-                    buffer.seek(0)
-                    audio_queue.put(buffer.getvalue())
+                for audio in self._segments(text):
+                    if stop.is_set():
+                        return
+                    put(_to_pcm16(audio))
+                    # Check again before the next segment is synthesized,
+                    # so a disconnect or barge-in costs no extra sentence
+                    if stop.is_set():
+                        return
             except Exception as e:
                 error_holder.append(e)
             finally:
-                audio_queue.put(None)  # Signal completion
-
-        # Start generation in background thread
-        thread = threading.Thread(target=generate_in_thread, daemon=True)
-        thread.start()
+                if not stop.is_set():
+                    put(None)  # Signal completion
 
-        # Yield chunks as they become available
-        while True:
-            try:
-                # Non-blocking check with small sleep to not block event loop
-                chunk = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: audio_queue.get(timeout=0.1)
-                )
-
-                if chunk is None:  # Generation complete
-                    break
+        try:
+            # Start generation on the synthesis thread
+            loop.run_in_executor(self._executor, generate_in_thread)
 
+            # Yield chunks as they become available
+            while (chunk := await audio_queue.get()) is not None:
                 yield chunk
-
-            except queue.Empty:
-                # Check if thread is still running
-                if not thread.is_alive() and audio_queue.empty():
-                    break
-                await asyncio.sleep(0.01)
+        finally:
+            # If the consumer stopped early, release a worker blocked on
+            # the full queue and let it exit
+            stop.set()
+            while not audio_queue.empty():
+                audio_queue.get_nowait()
+            _tts_sem.release()
+            self._schedule_offload()
 
         # Check for errors
         if error_holder:
@@ -277,6 +685,36 @@ class KokoroTTS:
             raise error_holder[0]
 
 
+def _wav_header(num_samples: int) -> bytearray:
+    """
+    Allocate a 16-bit mono WAV file at SAMPLE_RATE with its header filled in.
+
+    Args:
+        num_samples: Number of samples the data chunk will hold
+
+    Returns:
+        Buffer of the full file size; the sample data after the 44-byte
+        header is left zeroed for the caller to fill
+    """
+    data_size = 2 * num_samples
+    wav = bytearray(44 + data_size)
+    struct.pack_into(
+        "<4sI4s4sIHHIIHH4sI", wav, 0,
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, SAMPLE_RATE, 2 * SAMPLE_RATE, 2, 16,
+        b"data", data_size,
+    )
+    return wav
+
+
+def _to_pcm16(audio) -> bytes:
+    """Convert float audio in [-1, 1] to 16-bit little-endian PCM bytes."""
+    import numpy as np
+
+    samples = np.clip(np.asarray(audio, dtype=np.float32), -1.0, 1.0)
+    return np.rint(samples * 32767).astype("<i2").tobytes()
+
+
 # Singleton instance
 _tts: Optional[KokoroTTS] = None
 
@@ -296,9 +734,39 @@ def get_tts(voice: str = DEFAULT_VOICE) -> KokoroTTS:
 def reset_tts() -> None:
     """Reset the singleton to free memory."""
     global _tts
+    if _tts is not None:
+        if _tts._offload_timer is not None:
+            _tts._offload_timer.cancel()
+        _tts._executor.shutdown(wait=False)
     _tts = None
 
 
-def get_available_voices() -> dict:
-    """Get all available Kokoro voices."""
+def get_available_voices() -> Mapping[str, dict]:
+    """Get all available Kokoro voices (read-only)."""
     return KOKORO_VOICES
+
+
+def is_valid_voice(voice: str) -> bool:
+    """Check whether a voice ID is a known Kokoro voice."""
+    return voice in _VOICE_ID_SET
+
+
+def find_voices(lang: Optional[str] = None, gender: Optional[str] = None) -> tuple[str, ...]:
+    """
+    Look up voice IDs by language and/or gender.
+
+    Args:
+        lang: Language name as in KOKORO_VOICES (e.g. "British English")
+        gender: "female" or "male"
+
+    Returns:
+        Matching voice IDs in table order (all voices if no filter given)
+    """
+    if lang is None and gender is None:
+        return VOICE_IDS
+    if gender is None:
+        return _BY_LANG.get(lang, ())
+    if lang is None:
+        return _BY_GENDER.get(gender, ())
+    by_gender = set(_BY_GENDER.get(gender, ()))
+    return tuple(v for v in _BY_LANG.get(lang, ()) if v in by_gender)
@@ -9,7 +9,7 @@ from typing import Any, Optional
 
 from config import get_logger
 from sdk.base_agent import BaseAgent, load_prompt
-from sdk.tools.base import ToolRegistry
+from sdk.tools.base import shared_registry
 from sdk.tools.file_tools import ReadFileTool, WriteFileTool, ListDirectoryTool
 from sdk.tools.memory_tools import RecallTool
 
@@ -18,6 +18,16 @@ logger = get_logger(__name__)
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
 
+# Programmer tool set - focused on code writing
+_TOOLS = (
+    ReadFileTool,
+    WriteFileTool,
+    ListDirectoryTool,
+    # Read-only memory access
+    (RecallTool, "programmer"),
+)
+
+
 class Programmer(BaseAgent):
     """
     Programmer Worker - Writes and modifies code.
@@ -44,20 +54,13 @@ class Programmer(BaseAgent):
             max_turns=max_turns,
         )
 
-        self._tool_registry_obj = ToolRegistry()
+        self._tool_registry_obj = shared_registry(_TOOLS)
         self._setup_tools()
 
         logger.debug("Programmer worker initialized")
 
     def _setup_tools(self) -> None:
-        """Set up tools - focused on code writing."""
-        self._tool_registry_obj.register(ReadFileTool())
-        self._tool_registry_obj.register(WriteFileTool())
-        self._tool_registry_obj.register(ListDirectoryTool())
-
-        # Read-only memory access
-        self._tool_registry_obj.register(RecallTool("programmer"))
-
+        """Register handlers for the shared tool set."""
         for name in self._tool_registry_obj.get_tool_names():
             self.register_tool(name, self._tool_registry_obj.create_handler(name))
 
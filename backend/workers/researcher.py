@@ -9,7 +9,7 @@ from typing import Any, Optional
 
 from config import get_logger
 from sdk.base_agent import BaseAgent, load_prompt
-from sdk.tools.base import ToolRegistry
+from sdk.tools.base import shared_registry
 from sdk.tools.file_tools import ReadFileTool, ListDirectoryTool
 from sdk.tools.search_tools import GrepTool, GlobTool
 from sdk.tools.memory_tools import RecallTool
@@ -19,6 +19,17 @@ logger = get_logger(__name__)
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
 
+# Researcher tool set - focused on research
+_TOOLS = (
+    ReadFileTool,
+    ListDirectoryTool,
+    GrepTool,
+    GlobTool,
+    # Read-only memory access
+    (RecallTool, "researcher"),
+)
+
+
 class Researcher(BaseAgent):
     """
     Researcher Worker - Gathers information.
@@ -49,21 +60,13 @@ class Researcher(BaseAgent):
         )
 
         self._max_web_searches = max_web_searches
-        self._tool_registry_obj = ToolRegistry()
+        self._tool_registry_obj = shared_registry(_TOOLS)
         self._setup_tools()
 
         logger.debug("Researcher worker initialized")
 
     def _setup_tools(self) -> None:
-        """Set up tools - focused on research."""
-        self._tool_registry_obj.register(ReadFileTool())
-        self._tool_registry_obj.register(ListDirectoryTool())
-        self._tool_registry_obj.register(GrepTool())
-        self._tool_registry_obj.register(GlobTool())
-
-        # Read-only memory access
-        self._tool_registry_obj.register(RecallTool("researcher"))
-
+        """Register handlers for the shared tool set."""
         for name in self._tool_registry_obj.get_tool_names():
             self.register_tool(name, self._tool_registry_obj.create_handler(name))
 
@@ -9,7 +9,7 @@ from typing import Any, Optional
 
 from config import get_logger
 from sdk.base_agent import BaseAgent, load_prompt
-from sdk.tools.base import ToolRegistry
+from sdk.tools.base import shared_registry
 from sdk.tools.file_tools import ReadFileTool, ListDirectoryTool
 from sdk.tools.search_tools import GrepTool
 from sdk.tools.memory_tools import RecallTool
@@ -19,6 +19,16 @@ logger = get_logger(__name__)
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
 
+# Reviewer tool set - read-only for review
+_TOOLS = (
+    ReadFileTool,
+    ListDirectoryTool,
+    GrepTool,
+    # Read-only memory access
+    (RecallTool, "reviewer"),
+)
+
+
 class Reviewer(BaseAgent):
     """
     Reviewer Worker - Reviews code for issues.
@@ -46,20 +56,13 @@ class Reviewer(BaseAgent):
             max_turns=max_turns,
         )
 
-        self._tool_registry_obj = ToolRegistry()
+        self._tool_registry_obj = shared_registry(_TOOLS)
         self._setup_tools()
 
         logger.debug("Reviewer worker initialized")
 
     def _setup_tools(self) -> None:
-        """Set up tools - read-only for review."""
-        self._tool_registry_obj.register(ReadFileTool())
-        self._tool_registry_obj.register(ListDirectoryTool())
-        self._tool_registry_obj.register(GrepTool())
-
-        # Read-only memory access
-        self._tool_registry_obj.register(RecallTool("reviewer"))
-
+        """Register handlers for the shared tool set."""
         for name in self._tool_registry_obj.get_tool_names():
             self.register_tool(name, self._tool_registry_obj.create_handler(name))
 
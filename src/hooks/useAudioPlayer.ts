@@ -10,8 +10,8 @@ import { useState, useRef, useCallback } from "react";
 interface AudioPlayerState {
   /** Whether audio is currently playing */
   isPlaying: boolean;
-  /** Queue a base64 audio chunk for playback */
-  playChunk: (base64Audio: string) => Promise<void>;
+  /** Queue a base64 audio chunk (raw PCM or an encoded file) for playback */
+  playChunk: (base64Audio: string, format?: string, sampleRate?: number) => Promise<void>;
   /** Stop playback and clear queue */
   stop: () => void;
   /** Number of chunks waiting in queue */
@@ -68,7 +68,7 @@ export function useAudioPlayer(): AudioPlayerState {
   }, []);
 
   const playChunk = useCallback(
-    async (base64Audio: string) => {
+    async (base64Audio: string, format = "wav", sampleRate?: number) => {
       try {
         const ctx = getContext();
 
@@ -79,8 +79,20 @@ export function useAudioPlayer(): AudioPlayerState {
           bytes[i] = binaryString.charCodeAt(i);
         }
 
-        // Decode audio data
-        const audioBuffer = await ctx.decodeAudioData(bytes.buffer.slice(0));
+        let audioBuffer: AudioBuffer;
+        if (format === "pcm_s16le" && sampleRate) {
+          // Raw 16-bit mono PCM: fill the buffer directly, no decoder needed
+          const pcm = new DataView(bytes.buffer);
+          const frames = bytes.length >> 1;
+          audioBuffer = ctx.createBuffer(1, frames, sampleRate);
+          const channel = audioBuffer.getChannelData(0);
+          for (let i = 0; i < frames; i++) {
+            channel[i] = pcm.getInt16(i * 2, true) / 32768;
+          }
+        } else {
+          // Encoded audio (wav, mp3, ...)
+          audioBuffer = await ctx.decodeAudioData(bytes.buffer.slice(0));
+        }
 
         // Add to queue
         queueRef.current.push(audioBuffer);
@@ -307,7 +307,7 @@ export function useWebSocket(voiceCallbacks?: VoiceCallbacks) {
           case "voice.audio_chunk": {
             const payload = data.payload as unknown as VoiceAudioChunkPayload;
             console.log(`[Voice] Audio chunk received (${payload.format})`);
-            audioPlayerRef.current.playChunk(payload.audio);
+            audioPlayerRef.current.playChunk(payload.audio, payload.format, payload.sample_rate);
             break;
           }
 
@@ -494,15 +494,6 @@ export function useWebSocket(voiceCallbacks?: VoiceCallbacks) {
     }
 
     try {
-      // Convert blob to base64
-      const arrayBuffer = await audioBlob.arrayBuffer();
-      const bytes = new Uint8Array(arrayBuffer);
-      let binary = "";
-      for (let i = 0; i < bytes.length; i++) {
-        binary += String.fromCharCode(bytes[i]);
-      }
-      const base64Audio = btoa(binary);
-
       // Determine format from blob type
       const format = audioBlob.type.includes("webm")
         ? "webm"
@@ -516,13 +507,14 @@ export function useWebSocket(voiceCallbacks?: VoiceCallbacks) {
         source: "frontend",
         timestamp: new Date().toISOString(),
         payload: {
-          audio: base64Audio,
           format,
         },
       };
 
-      wsRef.current.send(JSON.stringify(event));
-      console.log(`[Voice] Sent ${bytes.length} bytes of audio (${format})`);
+      // Binary frame: JSON event header, newline, then the raw audio
+      // (avoids base64's size overhead and encode/decode passes)
+      wsRef.current.send(new Blob([JSON.stringify(event), "\n", audioBlob]));
+      console.log(`[Voice] Sent ${audioBlob.size} bytes of audio (${format})`);
     } catch (error) {
       console.error("Failed to send audio:", error);
     }
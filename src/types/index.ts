@@ -346,7 +346,8 @@ export interface VoiceTTSPayload {
  */
 export interface VoiceAudioChunkPayload {
   audio: string; // Base64 encoded audio chunk
-  format: string; // Audio format (wav from Kokoro TTS)
+  format: string; // Audio format (pcm_s16le from Kokoro TTS, or wav)
+  sample_rate?: number; // Sample rate for raw PCM chunks
 }
 
 /**